@@ -0,0 +1,121 @@
+# -------------------- AES Batch (NumPy) --------------------
+# Applies every AES round to all blocks of an (N, 16) uint8 array at once,
+# using fancy-indexed S-box lookups and the ShiftRows gather index from
+# AES_shiftrow. State layout is the same 16-byte column-major block.
+import numpy as np
+
+from Algorithms.AES_shiftrow import (
+    s_box,
+    inv_s_box,
+    SHIFT_ROWS,
+    INV_SHIFT_ROWS,
+    xtime,
+    expand_key,
+)
+
+SBOX = np.frombuffer(s_box, dtype=np.uint8)
+INV_SBOX = np.frombuffer(inv_s_box, dtype=np.uint8)
+XTIME = np.array([xtime(b) for b in range(256)], dtype=np.uint8)
+
+SHIFT_ROWS_INDEX = np.array(SHIFT_ROWS, dtype=np.intp)
+INV_SHIFT_ROWS_INDEX = np.array(INV_SHIFT_ROWS, dtype=np.intp)
+
+# -------------------- Helpers --------------------
+def as_blocks(data):
+    """View bytes-like data (length multiple of 16) as an (N, 16) uint8 array"""
+    if isinstance(data, np.ndarray):
+        blocks = data
+    else:
+        blocks = np.frombuffer(data, dtype=np.uint8)
+    if blocks.dtype != np.uint8 or blocks.size % 16:
+        raise ValueError("Blocks must be uint8 data whose length is a multiple of 16")
+    return blocks.reshape(-1, 16)
+
+def round_key_array(key):
+    """Expand a key into an (Nr+1, 16) uint8 array of round keys"""
+    words = np.array(expand_key(key), dtype=">u4")
+    return words.view(np.uint8).reshape(-1, 16)
+
+def mix_columns(state):
+    """MixColumns over every column of an (N, 16) state array"""
+    cols = state.reshape(-1, 4, 4)
+    rotated = np.roll(cols, -1, axis=2)
+    total = np.bitwise_xor.reduce(cols, axis=2, keepdims=True)
+    return (cols ^ total ^ XTIME[cols ^ rotated]).reshape(-1, 16)
+
+def inv_mix_columns(state):
+    """InvMixColumns, written as a pre-multiplication followed by MixColumns"""
+    cols = state.reshape(-1, 4, 4).copy()
+    u = XTIME[XTIME[cols[:, :, 0] ^ cols[:, :, 2]]]
+    v = XTIME[XTIME[cols[:, :, 1] ^ cols[:, :, 3]]]
+    cols[:, :, 0] ^= u
+    cols[:, :, 1] ^= v
+    cols[:, :, 2] ^= u
+    cols[:, :, 3] ^= v
+    return mix_columns(cols.reshape(-1, 16))
+
+# -------------------- Batch Encryption --------------------
+def aes_encrypt_blocks(blocks, key):
+    """Encrypt an (N, 16) uint8 array of blocks; returns a new array"""
+    round_keys = round_key_array(key)
+    rounds = len(round_keys) - 1
+
+    state = as_blocks(blocks) ^ round_keys[0]
+    for r in range(1, rounds):
+        state = SBOX[state[:, SHIFT_ROWS_INDEX]]
+        state = mix_columns(state)
+        state ^= round_keys[r]
+    state = SBOX[state[:, SHIFT_ROWS_INDEX]]
+    state ^= round_keys[rounds]
+    return state
+
+def aes_decrypt_blocks(blocks, key):
+    """Decrypt an (N, 16) uint8 array of blocks; returns a new array"""
+    round_keys = round_key_array(key)
+    rounds = len(round_keys) - 1
+
+    state = as_blocks(blocks) ^ round_keys[rounds]
+    for r in range(rounds - 1, 0, -1):
+        state = INV_SBOX[state[:, INV_SHIFT_ROWS_INDEX]]
+        state ^= round_keys[r]
+        state = inv_mix_columns(state)
+    state = INV_SBOX[state[:, INV_SHIFT_ROWS_INDEX]]
+    state ^= round_keys[0]
+    return state
+
+# -------------------- ECB / CTR --------------------
+def aes_ecb_encrypt(data, key):
+    """ECB-encrypt bytes whose length is a multiple of 16"""
+    return aes_encrypt_blocks(as_blocks(data), key).tobytes()
+
+def aes_ecb_decrypt(data, key):
+    """ECB-decrypt bytes whose length is a multiple of 16"""
+    return aes_decrypt_blocks(as_blocks(data), key).tobytes()
+
+def counter_blocks(initial_counter, count):
+    """
+    Build `count` consecutive 128-bit big-endian counter blocks
+    starting at `initial_counter` (an int or 16 bytes).
+    """
+    if not isinstance(initial_counter, int):
+        initial_counter = int.from_bytes(initial_counter, "big")
+    initial_counter &= (1 << 128) - 1
+    high = initial_counter >> 64
+    low = initial_counter & 0xFFFFFFFFFFFFFFFF
+
+    counters = np.empty((count, 2), dtype=">u8")
+    lows = np.arange(count, dtype=np.uint64) + np.uint64(low)  # wraps mod 2**64
+    counters[:, 1] = lows
+    counters[:, 0] = np.uint64(high) + (lows < np.uint64(low))  # carry into the high half
+    return counters.view(np.uint8).reshape(count, 16)
+
+def aes_ctr_keystream(key, initial_counter, count):
+    """Return `count` keystream blocks as an (N, 16) uint8 array"""
+    return aes_encrypt_blocks(counter_blocks(initial_counter, count), key)
+
+def aes_ctr_xor(data, key, initial_counter):
+    """CTR-mode encrypt/decrypt of arbitrary-length bytes (the operation is symmetric)"""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    count = -(-buf.size // 16)
+    stream = aes_ctr_keystream(key, initial_counter, count).reshape(-1)
+    return (buf ^ stream[:buf.size]).tobytes()
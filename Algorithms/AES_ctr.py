@@ -0,0 +1,85 @@
+# -------------------- AES-CTR Streaming --------------------
+# CTR keystream blocks depend only on (key, counter), so each chunk of a file
+# can be processed independently: chunk i starts at counter + offset // 16.
+# Chunks are fanned out to a process pool and written back in order, with a
+# bounded number in flight so memory stays flat for any file size.
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from Algorithms.AES_batch import aes_ctr_xor
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB, must be a multiple of the 16-byte block
+
+# -------------------- Helpers --------------------
+def _counter_to_int(initial_counter):
+    if isinstance(initial_counter, int):
+        return initial_counter
+    if len(initial_counter) != 16:
+        raise ValueError("Initial counter block must be 16 bytes")
+    return int.from_bytes(initial_counter, "big")
+
+def _read_chunk(src, size):
+    # Raw files and pipes may return short reads, but the counter advances by
+    # whole chunks, so keep reading until the chunk is full or the input ends
+    parts, remaining = [], size
+    while remaining:
+        part = src.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b"".join(parts)
+
+def _ctr_chunk(key, counter, data):
+    """Worker: XOR one chunk with its keystream starting at `counter`"""
+    return aes_ctr_xor(data, key, counter)
+
+# -------------------- Streaming --------------------
+def aes_ctr_stream(src, dst, key, initial_counter, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """
+    Encrypt/decrypt binary stream `src` into `dst` in AES-CTR mode.
+    workers=None uses one process per core; workers=1 runs in-process.
+    Returns the number of bytes written.
+    """
+    if chunk_size <= 0 or chunk_size % 16:
+        raise ValueError("chunk_size must be a positive multiple of 16")
+    if len(key) not in (16, 24, 32):
+        raise ValueError("AES key must be 16, 24 or 32 bytes long")
+    key = bytes(key)
+    counter = _counter_to_int(initial_counter)
+    blocks_per_chunk = chunk_size // 16
+    written = 0
+
+    if workers == 1:
+        while True:
+            data = _read_chunk(src, chunk_size)
+            if not data:
+                break
+            written += dst.write(_ctr_chunk(key, counter, data))
+            counter += blocks_per_chunk
+        return written
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            data = _read_chunk(src, chunk_size)
+            if not data:
+                break
+            pending.append(pool.submit(_ctr_chunk, key, counter, data))
+            counter += blocks_per_chunk
+            if len(pending) >= max_pending:
+                written += dst.write(pending.popleft().result())
+        while pending:
+            written += dst.write(pending.popleft().result())
+    return written
+
+def aes_ctr_encrypt_file(src_path, dst_path, key, initial_counter, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """Encrypt the file at src_path into dst_path; returns bytes written"""
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        return aes_ctr_stream(src, dst, key, initial_counter, chunk_size, workers)
+
+# CTR is its own inverse
+aes_ctr_decrypt_file = aes_ctr_encrypt_file
@@ -1,60 +1,204 @@
+import struct
+
 # -------------------- AES S-box --------------------
-s_box = [
-    [0x63,0x7c,0x77,0x7b,0xf2,0x6b,0x6f,0xc5,0x30,0x01,0x67,0x2b,0xfe,0xd7,0xab,0x76],
-    [0xca,0x82,0xc9,0x7d,0xfa,0x59,0x47,0xf0,0xad,0xd4,0xa2,0xaf,0x9c,0xa4,0x72,0xc0],
-    [0xb7,0xfd,0x93,0x26,0x36,0x3f,0xf7,0xcc,0x34,0xa5,0xe5,0xf1,0x71,0xd8,0x31,0x15],
-    [0x04,0xc7,0x23,0xc3,0x18,0x96,0x05,0x9a,0x07,0x12,0x80,0xe2,0xeb,0x27,0xb2,0x75],
-    [0x09,0x83,0x2c,0x1a,0x1b,0x6e,0x5a,0xa0,0x52,0x3b,0xd6,0xb3,0x29,0xe3,0x2f,0x84],
-    [0x53,0xd1,0x00,0xed,0x20,0xfc,0xb1,0x5b,0x6a,0xcb,0xbe,0x39,0x4a,0x4c,0x58,0xcf],
-    [0xd0,0xef,0xaa,0xfb,0x43,0x4d,0x33,0x85,0x45,0xf9,0x02,0x7f,0x50,0x3c,0x9f,0xa8],
-    [0x51,0xa3,0x40,0x8f,0x92,0x9d,0x38,0xf5,0xbc,0xb6,0xda,0x21,0x10,0xff,0xf3,0xd2],
-    [0xcd,0x0c,0x13,0xec,0x5f,0x97,0x44,0x17,0xc4,0xa7,0x7e,0x3d,0x64,0x5d,0x19,0x73],
-    [0x60,0x81,0x4f,0xdc,0x22,0x2a,0x90,0x88,0x46,0xee,0xb8,0x14,0xde,0x5e,0x0b,0xdb],
-    [0xe0,0x32,0x3a,0x0a,0x49,0x06,0x24,0x5c,0xc2,0xd3,0xac,0x62,0x91,0x95,0xe4,0x79],
-    [0xe7,0xc8,0x37,0x6d,0x8d,0xd5,0x4e,0xa9,0x6c,0x56,0xf4,0xea,0x65,0x7a,0xae,0x08],
-    [0xba,0x78,0x25,0x2e,0x1c,0xa6,0xb4,0xc6,0xe8,0xdd,0x74,0x1f,0x4b,0xbd,0x8b,0x8a],
-    [0x70,0x3e,0xb5,0x66,0x48,0x03,0xf6,0x0e,0x61,0x35,0x57,0xb9,0x86,0xc1,0x1d,0x9e],
-    [0xe1,0xf8,0x98,0x11,0x69,0xd9,0x8e,0x94,0x9b,0x1e,0x87,0xe9,0xce,0x55,0x28,0xdf],
-    [0x8c,0xa1,0x89,0x0d,0xbf,0xe6,0x42,0x68,0x41,0x99,0x2d,0x0f,0xb0,0x54,0xbb,0x16]
-]
-
-# -------------------- Helper Functions --------------------
+s_box = bytes([
+    0x63,0x7c,0x77,0x7b,0xf2,0x6b,0x6f,0xc5,0x30,0x01,0x67,0x2b,0xfe,0xd7,0xab,0x76,
+    0xca,0x82,0xc9,0x7d,0xfa,0x59,0x47,0xf0,0xad,0xd4,0xa2,0xaf,0x9c,0xa4,0x72,0xc0,
+    0xb7,0xfd,0x93,0x26,0x36,0x3f,0xf7,0xcc,0x34,0xa5,0xe5,0xf1,0x71,0xd8,0x31,0x15,
+    0x04,0xc7,0x23,0xc3,0x18,0x96,0x05,0x9a,0x07,0x12,0x80,0xe2,0xeb,0x27,0xb2,0x75,
+    0x09,0x83,0x2c,0x1a,0x1b,0x6e,0x5a,0xa0,0x52,0x3b,0xd6,0xb3,0x29,0xe3,0x2f,0x84,
+    0x53,0xd1,0x00,0xed,0x20,0xfc,0xb1,0x5b,0x6a,0xcb,0xbe,0x39,0x4a,0x4c,0x58,0xcf,
+    0xd0,0xef,0xaa,0xfb,0x43,0x4d,0x33,0x85,0x45,0xf9,0x02,0x7f,0x50,0x3c,0x9f,0xa8,
+    0x51,0xa3,0x40,0x8f,0x92,0x9d,0x38,0xf5,0xbc,0xb6,0xda,0x21,0x10,0xff,0xf3,0xd2,
+    0xcd,0x0c,0x13,0xec,0x5f,0x97,0x44,0x17,0xc4,0xa7,0x7e,0x3d,0x64,0x5d,0x19,0x73,
+    0x60,0x81,0x4f,0xdc,0x22,0x2a,0x90,0x88,0x46,0xee,0xb8,0x14,0xde,0x5e,0x0b,0xdb,
+    0xe0,0x32,0x3a,0x0a,0x49,0x06,0x24,0x5c,0xc2,0xd3,0xac,0x62,0x91,0x95,0xe4,0x79,
+    0xe7,0xc8,0x37,0x6d,0x8d,0xd5,0x4e,0xa9,0x6c,0x56,0xf4,0xea,0x65,0x7a,0xae,0x08,
+    0xba,0x78,0x25,0x2e,0x1c,0xa6,0xb4,0xc6,0xe8,0xdd,0x74,0x1f,0x4b,0xbd,0x8b,0x8a,
+    0x70,0x3e,0xb5,0x66,0x48,0x03,0xf6,0x0e,0x61,0x35,0x57,0xb9,0x86,0xc1,0x1d,0x9e,
+    0xe1,0xf8,0x98,0x11,0x69,0xd9,0x8e,0x94,0x9b,0x1e,0x87,0xe9,0xce,0x55,0x28,0xdf,
+    0x8c,0xa1,0x89,0x0d,0xbf,0xe6,0x42,0x68,0x41,0x99,0x2d,0x0f,0xb0,0x54,0xbb,0x16
+])
+
+# Inverse S-box, derived once from the forward table
+inv_s_box = bytearray(256)
+for _i, _b in enumerate(s_box):
+    inv_s_box[_b] = _i
+inv_s_box = bytes(inv_s_box)
+del _i, _b
+
+# ShiftRows as a gather over the 16-byte column-major state:
+# new_state[i] = state[SHIFT_ROWS[i]]
+SHIFT_ROWS = (0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11)
+INV_SHIFT_ROWS = tuple(SHIFT_ROWS.index(i) for i in range(16))
+
+# Round constants for the key schedule
+RCON = (0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1B, 0x36)
+
+# -------------------- GF(2^8) Arithmetic --------------------
+def xtime(a):
+    """Multiply a byte by x (i.e. 0x02) in GF(2^8)"""
+    a <<= 1
+    return (a ^ 0x11B) if a & 0x100 else a
+
+def gmul(a, b):
+    """Multiply two bytes in GF(2^8)"""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a = xtime(a)
+        b >>= 1
+    return result
+
+# -------------------- T-tables --------------------
+# Each entry fuses SubBytes, ShiftRows and MixColumns for one input byte
+# into a 32-bit column word; Te1..Te3 (Td1..Td3) are byte rotations of Te0 (Td0).
+def _ror8(w):
+    return ((w >> 8) | (w << 24)) & 0xFFFFFFFF
+
+def _build_tables(box, coeffs):
+    c0, c1, c2, c3 = coeffs
+    t0 = []
+    for b in box:
+        t0.append((gmul(b, c0) << 24) | (gmul(b, c1) << 16) | (gmul(b, c2) << 8) | gmul(b, c3))
+    t1 = [_ror8(w) for w in t0]
+    t2 = [_ror8(w) for w in t1]
+    t3 = [_ror8(w) for w in t2]
+    return t0, t1, t2, t3
+
+Te0, Te1, Te2, Te3 = _build_tables(s_box, (2, 1, 1, 3))
+Td0, Td1, Td2, Td3 = _build_tables(inv_s_box, (14, 9, 13, 11))
+
+_unpack_block = struct.Struct(">4I").unpack
+_pack_block = struct.Struct(">4I").pack
+
+# -------------------- State Helpers --------------------
 def block_to_state(block):
-    state = [[0]*4 for _ in range(4)]
-    for i in range(16):
-        row = i % 4
-        col = i // 4
-        state[row][col] = block[i]
-    return state
+    """Return the 16-byte column-major AES state for a block"""
+    if len(block) != 16:
+        raise ValueError("AES block must be exactly 16 bytes")
+    return bytearray(block)
 
 def sub_bytes(state):
-    for i in range(4):
-        for j in range(4):
-            byte = state[i][j]
-            state[i][j] = s_box[byte >> 4][byte & 0x0F]
+    """Apply the S-box to every byte of the state in place"""
+    state[:] = state.translate(s_box)
     return state
 
 def shift_rows(state):
-    new_state = [row[:] for row in state]
-    for i in range(1,4):
-        new_state[i] = state[i][i:] + state[i][:i]
-    return new_state
+    """Cyclically shift row r of the state left by r positions"""
+    return bytearray(state[i] for i in SHIFT_ROWS)
 
 def hex_to_bytes(hex_str):
-    return [int(hex_str[i:i+2],16) for i in range(0, len(hex_str), 2)]
+    return bytes.fromhex(hex_str)
 
 def state_to_hex_string(state):
-    return ' '.join([f"{b:02X}" for row in state for b in row])
+    """Format the state row by row, as it is usually drawn"""
+    return ' '.join(f"{state[row + 4 * col]:02X}" for row in range(4) for col in range(4))
 
-# -------------------- Main --------------------
-plaintext = input("Enter 32-hex plaintext: ")
+# -------------------- Key Expansion --------------------
+def expand_key(key):
+    """
+    Expand a 16/24/32-byte key into the encryption key schedule.
+    Returns a list of 4*(Nr+1) 32-bit round-key words.
+    """
+    nk = len(key) // 4
+    if len(key) not in (16, 24, 32):
+        raise ValueError("AES key must be 16, 24 or 32 bytes long")
+    rounds = nk + 6
+
+    words = list(struct.unpack(f">{nk}I", bytes(key)))
+    for i in range(nk, 4 * (rounds + 1)):
+        temp = words[i - 1]
+        if i % nk == 0:
+            temp = ((temp << 8) | (temp >> 24)) & 0xFFFFFFFF
+            temp = ((s_box[temp >> 24] << 24) | (s_box[(temp >> 16) & 0xFF] << 16)
+                    | (s_box[(temp >> 8) & 0xFF] << 8) | s_box[temp & 0xFF])
+            temp ^= RCON[i // nk - 1] << 24
+        elif nk > 6 and i % nk == 4:
+            temp = ((s_box[temp >> 24] << 24) | (s_box[(temp >> 16) & 0xFF] << 16)
+                    | (s_box[(temp >> 8) & 0xFF] << 8) | s_box[temp & 0xFF])
+        words.append(words[i - nk] ^ temp)
+    return words
+
+def expand_decrypt_key(key):
+    """
+    Build the key schedule for the equivalent inverse cipher:
+    round keys in reverse order, with InvMixColumns applied to the inner rounds.
+    """
+    enc = expand_key(key)
+    rounds = len(enc) // 4 - 1
+    dec = enc[4 * rounds:4 * rounds + 4]
+    for r in range(rounds - 1, 0, -1):
+        for w in enc[4 * r:4 * r + 4]:
+            dec.append(Td0[s_box[w >> 24]] ^ Td1[s_box[(w >> 16) & 0xFF]]
+                       ^ Td2[s_box[(w >> 8) & 0xFF]] ^ Td3[s_box[w & 0xFF]])
+    dec.extend(enc[0:4])
+    return dec
+
+# -------------------- Block Encryption --------------------
+def aes_encrypt_block(block, round_keys):
+    """Encrypt one 16-byte block with a schedule from expand_key()"""
+    s0, s1, s2, s3 = _unpack_block(block)
+    rk = round_keys
+    s0 ^= rk[0]; s1 ^= rk[1]; s2 ^= rk[2]; s3 ^= rk[3]
+
+    te0, te1, te2, te3 = Te0, Te1, Te2, Te3
+    last = len(rk) - 4
+    for k in range(4, last, 4):
+        t0 = te0[s0 >> 24] ^ te1[(s1 >> 16) & 0xFF] ^ te2[(s2 >> 8) & 0xFF] ^ te3[s3 & 0xFF] ^ rk[k]
+        t1 = te0[s1 >> 24] ^ te1[(s2 >> 16) & 0xFF] ^ te2[(s3 >> 8) & 0xFF] ^ te3[s0 & 0xFF] ^ rk[k + 1]
+        t2 = te0[s2 >> 24] ^ te1[(s3 >> 16) & 0xFF] ^ te2[(s0 >> 8) & 0xFF] ^ te3[s1 & 0xFF] ^ rk[k + 2]
+        t3 = te0[s3 >> 24] ^ te1[(s0 >> 16) & 0xFF] ^ te2[(s1 >> 8) & 0xFF] ^ te3[s2 & 0xFF] ^ rk[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
 
-block = hex_to_bytes(plaintext)
-state = block_to_state(block)
+    # Final round: SubBytes + ShiftRows + AddRoundKey (no MixColumns)
+    sb = s_box
+    return _pack_block(
+        ((sb[s0 >> 24] << 24) | (sb[(s1 >> 16) & 0xFF] << 16) | (sb[(s2 >> 8) & 0xFF] << 8) | sb[s3 & 0xFF]) ^ rk[last],
+        ((sb[s1 >> 24] << 24) | (sb[(s2 >> 16) & 0xFF] << 16) | (sb[(s3 >> 8) & 0xFF] << 8) | sb[s0 & 0xFF]) ^ rk[last + 1],
+        ((sb[s2 >> 24] << 24) | (sb[(s3 >> 16) & 0xFF] << 16) | (sb[(s0 >> 8) & 0xFF] << 8) | sb[s1 & 0xFF]) ^ rk[last + 2],
+        ((sb[s3 >> 24] << 24) | (sb[(s0 >> 16) & 0xFF] << 16) | (sb[(s1 >> 8) & 0xFF] << 8) | sb[s2 & 0xFF]) ^ rk[last + 3],
+    )
 
-# SubBytes + ShiftRows
-state = sub_bytes(state)
-state = shift_rows(state)
+def aes_decrypt_block(block, round_keys):
+    """Decrypt one 16-byte block with a schedule from expand_decrypt_key()"""
+    s0, s1, s2, s3 = _unpack_block(block)
+    rk = round_keys
+    s0 ^= rk[0]; s1 ^= rk[1]; s2 ^= rk[2]; s3 ^= rk[3]
+
+    td0, td1, td2, td3 = Td0, Td1, Td2, Td3
+    last = len(rk) - 4
+    for k in range(4, last, 4):
+        t0 = td0[s0 >> 24] ^ td1[(s3 >> 16) & 0xFF] ^ td2[(s2 >> 8) & 0xFF] ^ td3[s1 & 0xFF] ^ rk[k]
+        t1 = td0[s1 >> 24] ^ td1[(s0 >> 16) & 0xFF] ^ td2[(s3 >> 8) & 0xFF] ^ td3[s2 & 0xFF] ^ rk[k + 1]
+        t2 = td0[s2 >> 24] ^ td1[(s1 >> 16) & 0xFF] ^ td2[(s0 >> 8) & 0xFF] ^ td3[s3 & 0xFF] ^ rk[k + 2]
+        t3 = td0[s3 >> 24] ^ td1[(s2 >> 16) & 0xFF] ^ td2[(s1 >> 8) & 0xFF] ^ td3[s0 & 0xFF] ^ rk[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+
+    # Final round: InvShiftRows + InvSubBytes + AddRoundKey
+    ib = inv_s_box
+    return _pack_block(
+        ((ib[s0 >> 24] << 24) | (ib[(s3 >> 16) & 0xFF] << 16) | (ib[(s2 >> 8) & 0xFF] << 8) | ib[s1 & 0xFF]) ^ rk[last],
+        ((ib[s1 >> 24] << 24) | (ib[(s0 >> 16) & 0xFF] << 16) | (ib[(s3 >> 8) & 0xFF] << 8) | ib[s2 & 0xFF]) ^ rk[last + 1],
+        ((ib[s2 >> 24] << 24) | (ib[(s1 >> 16) & 0xFF] << 16) | (ib[(s0 >> 8) & 0xFF] << 8) | ib[s3 & 0xFF]) ^ rk[last + 2],
+        ((ib[s3 >> 24] << 24) | (ib[(s2 >> 16) & 0xFF] << 16) | (ib[(s1 >> 8) & 0xFF] << 8) | ib[s0 & 0xFF]) ^ rk[last + 3],
+    )
+
+# -------------------- SubBytes + ShiftRows Demo --------------------
+def sub_bytes_shift_rows_hex(hex_str):
+    """Apply SubBytes then ShiftRows to one 32-hex-digit block; returns the state as hex"""
+    hex_str = hex_str.strip()
+    if len(hex_str) != 32:
+        raise ValueError("Enter 32 hex characters (16 bytes)!")
+    state = block_to_state(hex_to_bytes(hex_str))
+    state = sub_bytes(state)
+    state = shift_rows(state)
+    return state_to_hex_string(state)
+
+# -------------------- Main --------------------
+if __name__ == "__main__":
+    plaintext = input("Enter 32-hex plaintext: ")
 
-print("\nResult after ShiftRows:")
-print(state_to_hex_string(state))
\ No newline at end of file
+    print("\nResult after ShiftRows:")
+    print(sub_bytes_shift_rows_hex(plaintext))
@@ -0,0 +1,214 @@
+# -------------------- DES / Triple-DES Block Cipher --------------------
+# Built on the integer key schedule in DES_keygen. Each Feistel round is
+# eight combined S-box + P-permutation (SP) table lookups XORed together
+# on 32-bit ints; IP and FP use byte-indexed permutation tables.
+from Algorithms.DES_keygen import (
+    build_permutation_tables,
+    permute_int,
+    des_round_keys,
+    key_to_int,
+    key_schedule_cache,
+    cached_round_keys,
+)
+
+# Initial Permutation (IP)
+IP = [
+    58,50,42,34,26,18,10,2,
+    60,52,44,36,28,20,12,4,
+    62,54,46,38,30,22,14,6,
+    64,56,48,40,32,24,16,8,
+    57,49,41,33,25,17,9,1,
+    59,51,43,35,27,19,11,3,
+    61,53,45,37,29,21,13,5,
+    63,55,47,39,31,23,15,7
+]
+
+# Final Permutation (FP = IP^-1)
+FP = [
+    40,8,48,16,56,24,64,32,
+    39,7,47,15,55,23,63,31,
+    38,6,46,14,54,22,62,30,
+    37,5,45,13,53,21,61,29,
+    36,4,44,12,52,20,60,28,
+    35,3,43,11,51,19,59,27,
+    34,2,42,10,50,18,58,26,
+    33,1,41,9,49,17,57,25
+]
+
+# Permutation P applied to the S-box output
+P = [
+    16,7,20,21,29,12,28,17,
+    1,15,23,26,5,18,31,10,
+    2,8,24,14,32,27,3,9,
+    19,13,30,6,22,11,4,25
+]
+
+# S-boxes S1..S8, each 4 rows x 16 columns
+S_BOXES = [
+    [[14,4,13,1,2,15,11,8,3,10,6,12,5,9,0,7],
+     [0,15,7,4,14,2,13,1,10,6,12,11,9,5,3,8],
+     [4,1,14,8,13,6,2,11,15,12,9,7,3,10,5,0],
+     [15,12,8,2,4,9,1,7,5,11,3,14,10,0,6,13]],
+    [[15,1,8,14,6,11,3,4,9,7,2,13,12,0,5,10],
+     [3,13,4,7,15,2,8,14,12,0,1,10,6,9,11,5],
+     [0,14,7,11,10,4,13,1,5,8,12,6,9,3,2,15],
+     [13,8,10,1,3,15,4,2,11,6,7,12,0,5,14,9]],
+    [[10,0,9,14,6,3,15,5,1,13,12,7,11,4,2,8],
+     [13,7,0,9,3,4,6,10,2,8,5,14,12,11,15,1],
+     [13,6,4,9,8,15,3,0,11,1,2,12,5,10,14,7],
+     [1,10,13,0,6,9,8,7,4,15,14,3,11,5,2,12]],
+    [[7,13,14,3,0,6,9,10,1,2,8,5,11,12,4,15],
+     [13,8,11,5,6,15,0,3,4,7,2,12,1,10,14,9],
+     [10,6,9,0,12,11,7,13,15,1,3,14,5,2,8,4],
+     [3,15,0,6,10,1,13,8,9,4,5,11,12,7,2,14]],
+    [[2,12,4,1,7,10,11,6,8,5,3,15,13,0,14,9],
+     [14,11,2,12,4,7,13,1,5,0,15,10,3,9,8,6],
+     [4,2,1,11,10,13,7,8,15,9,12,5,6,3,0,14],
+     [11,8,12,7,1,14,2,13,6,15,0,9,10,4,5,3]],
+    [[12,1,10,15,9,2,6,8,0,13,3,4,14,7,5,11],
+     [10,15,4,2,7,12,9,5,6,1,13,14,0,11,3,8],
+     [9,14,15,5,2,8,12,3,7,0,4,10,1,13,11,6],
+     [4,3,2,12,9,5,15,10,11,14,1,7,6,0,8,13]],
+    [[4,11,2,14,15,0,8,13,3,12,9,7,5,10,6,1],
+     [13,0,11,7,4,9,1,10,14,3,5,12,2,15,8,6],
+     [1,4,11,13,12,3,7,14,10,15,6,8,0,5,9,2],
+     [6,11,13,8,1,4,10,7,9,5,0,15,14,2,3,12]],
+    [[13,2,8,4,6,15,11,1,10,9,3,14,5,0,12,7],
+     [1,15,13,8,10,3,7,4,12,5,6,11,0,14,9,2],
+     [7,11,4,1,9,12,14,2,0,6,10,13,15,3,5,8],
+     [2,1,14,7,4,10,8,13,15,12,9,0,3,5,6,11]]
+]
+
+# -------------------- Precomputed Tables --------------------
+
+IP_TABLES = build_permutation_tables(IP, 64)
+FP_TABLES = build_permutation_tables(FP, 64)
+
+def _apply_p(value32):
+    """Apply P to a 32-bit int (only used while building the SP tables)"""
+    out = 0
+    for i, pos in enumerate(P):
+        if value32 & (1 << (32 - pos)):
+            out |= 1 << (31 - i)
+    return out
+
+def _build_sp_tables():
+    """
+    SP[i][b] = P(S_i(b) placed in nibble i) for every 6-bit input b,
+    so the round function is the XOR of eight lookups.
+    """
+    tables = []
+    for i, box in enumerate(S_BOXES):
+        row = []
+        for b in range(64):
+            s = box[((b >> 4) & 0x2) | (b & 1)][(b >> 1) & 0xF]
+            row.append(_apply_p(s << (28 - 4 * i)))
+        tables.append(row)
+    return tables
+
+SP = _build_sp_tables()
+
+# -------------------- Block Operations --------------------
+
+def des_crypt_block(block, round_keys):
+    """
+    Run IP, 16 Feistel rounds and FP on a 64-bit integer block.
+    Pass the round keys reversed to decrypt.
+    """
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = SP
+    x = permute_int(block, IP_TABLES)
+    L = x >> 32
+    R = x & 0xFFFFFFFF
+
+    for k in round_keys:
+        # E expansion: the eight 6-bit groups are windows of R with one
+        # bit of wrap-around on each side
+        e = ((R & 1) << 33) | (R << 1) | (R >> 31)
+        L, R = R, L ^ (
+            sp0[((e >> 28) ^ (k >> 42)) & 0x3F]
+            ^ sp1[((e >> 24) ^ (k >> 36)) & 0x3F]
+            ^ sp2[((e >> 20) ^ (k >> 30)) & 0x3F]
+            ^ sp3[((e >> 16) ^ (k >> 24)) & 0x3F]
+            ^ sp4[((e >> 12) ^ (k >> 18)) & 0x3F]
+            ^ sp5[((e >> 8) ^ (k >> 12)) & 0x3F]
+            ^ sp6[((e >> 4) ^ (k >> 6)) & 0x3F]
+            ^ sp7[(e ^ k) & 0x3F]
+        )
+
+    # Undo the final swap, then FP
+    return permute_int((R << 32) | L, FP_TABLES)
+
+def des_encrypt_block(block, round_keys):
+    """Encrypt a 64-bit integer block with keys from des_round_keys()"""
+    return des_crypt_block(block, round_keys)
+
+def des_decrypt_block(block, round_keys):
+    """Decrypt a 64-bit integer block with keys from des_round_keys()"""
+    return des_crypt_block(block, round_keys[::-1])
+
+# -------------------- Triple-DES (EDE) --------------------
+
+def parse_3des_key(key_input):
+    """
+    Parse a Triple-DES key into three 64-bit ints (K1, K2, K3).
+    Accepts 32 hex digits (two-key, K3 = K1), 48 hex digits (three-key),
+    or a sequence of 2 or 3 keys each in any form accepted by DES.
+    Raises ValueError for invalid input
+    """
+    if isinstance(key_input, str):
+        key_input = key_input.strip()
+        if len(key_input) not in (32, 48):
+            raise ValueError("Invalid 3DES key! Must be 32 or 48 hex digits.")
+        parts = [key_input[i:i + 16] for i in range(0, len(key_input), 16)]
+    else:
+        parts = list(key_input)
+        if len(parts) not in (2, 3):
+            raise ValueError("Invalid 3DES key! Must contain 2 or 3 DES keys.")
+    keys = [key_to_int(part) for part in parts]
+    if len(keys) == 2:
+        keys.append(keys[0])
+    return keys
+
+def triple_des_round_keys(key_input):
+    """
+    Build the three 16-entry schedules used by EDE encryption:
+    encrypt with K1, decrypt with K2, encrypt with K3
+    """
+    k1, k2, k3 = (key_schedule_cache.get(k) for k in parse_3des_key(key_input))
+    return k1, k2[::-1], k3
+
+def triple_des_encrypt_block(block, schedules):
+    """Encrypt a 64-bit block with schedules from triple_des_round_keys()"""
+    k1, k2_rev, k3 = schedules
+    return des_crypt_block(des_crypt_block(des_crypt_block(block, k1), k2_rev), k3)
+
+def triple_des_decrypt_block(block, schedules):
+    """Decrypt a 64-bit block with schedules from triple_des_round_keys()"""
+    k1, k2_rev, k3 = schedules
+    return des_crypt_block(des_crypt_block(des_crypt_block(block, k3[::-1]), k2_rev[::-1]), k1[::-1])
+
+# -------------------- ECB over Bytes --------------------
+
+def _ecb(data, block_fn, schedule):
+    if len(data) % 8:
+        raise ValueError("Data length must be a multiple of 8 bytes")
+    out = bytearray(len(data))
+    for i in range(0, len(data), 8):
+        out[i:i + 8] = block_fn(int.from_bytes(data[i:i + 8], "big"), schedule).to_bytes(8, "big")
+    return bytes(out)
+
+def des_encrypt(data, key_input):
+    """ECB-encrypt bytes (length multiple of 8) under a hex/binary DES key"""
+    return _ecb(data, des_crypt_block, cached_round_keys(key_input))
+
+def des_decrypt(data, key_input):
+    """ECB-decrypt bytes (length multiple of 8) under a hex/binary DES key"""
+    return _ecb(data, des_crypt_block, cached_round_keys(key_input)[::-1])
+
+def triple_des_encrypt(data, key_input):
+    """ECB-encrypt bytes (length multiple of 8) with Triple-DES EDE"""
+    return _ecb(data, triple_des_encrypt_block, triple_des_round_keys(key_input))
+
+def triple_des_decrypt(data, key_input):
+    """ECB-decrypt bytes (length multiple of 8) with Triple-DES EDE"""
+    return _ecb(data, triple_des_decrypt_block, triple_des_round_keys(key_input))
@@ -0,0 +1,269 @@
+# -------------------- Bitsliced DES (NumPy) --------------------
+# Encrypts blocks 64 at a time per machine word.
+#   - Data is transposed into 64 bit-planes. Plane i is a uint64 array whose
+#     bit l in word w is DES bit i + 1 of block 64 * w + l.
+#   - IP, E, P and FP become reorderings of whole planes.
+#   - A round-key bit is an all-zeros or all-ones mask.
+#   - Each S-box is a boolean circuit (AND / OR / XOR / NOT over planes),
+#     evaluated for every lane at once.
+# Round keys come from des_key_generation() in DES_keygen, so the key
+# handling (and its cache) is shared with the per-block DES in DES.py.
+#
+# The circuits are derived from the S-box tables at import time. Each output
+# bit is split recursively into multiplexers over the six input bits, and
+# identical sub-functions (or their complements) are shared across the four
+# outputs. SBOX_VARIABLE_ORDERS holds the split order that gave the fewest
+# gates per S-box (about 1040 gates per round for all eight).
+import numpy as np
+
+from Algorithms.DES import IP, FP, P, S_BOXES, des_crypt_block, parse_3des_key
+from Algorithms.DES_keygen import des_key_generation
+
+# Expansion permutation (E)
+E = [
+    32,1,2,3,4,5,
+    4,5,6,7,8,9,
+    8,9,10,11,12,13,
+    12,13,14,15,16,17,
+    16,17,18,19,20,21,
+    20,21,22,23,24,25,
+    24,25,26,27,28,29,
+    28,29,30,31,32,1
+]
+
+IP_INDEX = np.array(IP) - 1
+FP_INDEX = np.array(FP) - 1
+E_INDEX = np.array(E) - 1
+P_INDEX = np.array(P) - 1
+
+LANES = 64
+BATCH_BLOCKS = 1 << 16  # blocks transposed and encrypted per batch (512 KiB)
+# Below this many blocks the fixed cost of a bitsliced pass (~25 ms) loses to
+# per-block DES, so short inputs go through des_crypt_block instead
+MIN_BITSLICED_BLOCKS = 512
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Split order per S-box: circuit variable i is S-box input bit order[i],
+# where input bits are numbered 0 (b6, least significant) .. 5 (b1)
+SBOX_VARIABLE_ORDERS = (
+    (3, 1, 4, 5, 0, 2),
+    (0, 3, 2, 1, 5, 4),
+    (0, 3, 2, 1, 4, 5),
+    (5, 3, 2, 1, 4, 0),
+    (1, 5, 4, 3, 0, 2),
+    (0, 4, 5, 2, 1, 3),
+    (4, 2, 1, 3, 5, 0),
+    (4, 2, 3, 1, 5, 0),
+)
+
+# -------------------- S-Box Circuits --------------------
+
+CONST0, CONST1 = -1, -2
+
+
+def sbox_truth_tables(box, order=tuple(range(6))):
+    """
+    Four 64-bit truth tables (output bits MSB first) of an S-box, indexed
+    by the circuit variables: bit i of the index is input bit order[i]
+    """
+    tables = [0] * 4
+    for y in range(64):
+        x = 0
+        for i, bit in enumerate(order):
+            if y >> i & 1:
+                x |= 1 << bit
+        s = box[((x >> 4) & 2) | (x & 1)][(x >> 1) & 0xF]
+        for j in range(4):
+            if s >> (3 - j) & 1:
+                tables[j] |= 1 << y
+    return tables
+
+
+def compile_sbox(box, order):
+    """
+    Build the gate program for one S-box.
+    Returns (program, outputs): program is a list of (op, dst, *srcs) over
+    registers 0..5 = S-box input bits b1..b6 (plus temporaries); outputs
+    are the registers holding the four output bits, MSB first.
+    """
+    program = []
+    memo = {}
+    next_reg = [6]
+    # circuit variable i is input bit order[i]; input bit o is register 5 - o
+    var_reg = [5 - bit for bit in order]
+
+    def emit(op, *srcs):
+        dst = next_reg[0]
+        next_reg[0] += 1
+        program.append((op, dst) + srcs)
+        return dst
+
+    def build(tt, n):
+        mask = (1 << (1 << n)) - 1
+        if tt == 0:
+            return CONST0
+        if tt == mask:
+            return CONST1
+        if (tt, n) in memo:
+            return memo[(tt, n)]
+        half = 1 << (n - 1)
+        low_mask = (1 << half) - 1
+        lo, hi = tt & low_mask, tt >> half
+        if lo == hi:
+            reg = build(lo, n - 1)
+        elif (~tt & mask, n) in memo:
+            reg = emit("not", memo[(~tt & mask, n)])
+        else:
+            s = var_reg[n - 1]
+            a, b = build(lo, n - 1), build(hi, n - 1)
+            if a == CONST0 and b == CONST1:
+                reg = s
+            elif a == CONST1 and b == CONST0:
+                reg = emit("not", s)
+            elif a == CONST0:
+                reg = emit("and", b, s)
+            elif b == CONST0:
+                reg = emit("andnot", a, s)
+            elif a == CONST1:
+                reg = emit("ornot", b, s)
+            elif b == CONST1:
+                reg = emit("or", a, s)
+            elif hi == ~lo & low_mask:
+                reg = emit("xor", a, s)
+            else:
+                reg = emit("mux", s, a, b)
+        memo[(tt, n)] = reg
+        return reg
+
+    outputs = [build(tt, 6) for tt in sbox_truth_tables(box, order)]
+    return program, outputs
+
+
+SBOX_CIRCUITS = [compile_sbox(box, order) for box, order in zip(S_BOXES, SBOX_VARIABLE_ORDERS)]
+
+
+def eval_sbox(circuit, inputs):
+    """Evaluate a compiled S-box on six bit-planes (b1..b6); returns four planes"""
+    program, outputs = circuit
+    regs = list(inputs)
+    regs.extend([None] * len(program))
+    for op, dst, *src in program:
+        if op == "mux":
+            s, a, b = regs[src[0]], regs[src[1]], regs[src[2]]
+            regs[dst] = a ^ ((a ^ b) & s)
+            continue
+        a = regs[src[0]]
+        if op == "not":
+            regs[dst] = ~a
+        elif op == "xor":
+            regs[dst] = a ^ regs[src[1]]
+        elif op == "and":
+            regs[dst] = a & regs[src[1]]
+        elif op == "andnot":
+            regs[dst] = a & ~regs[src[1]]
+        elif op == "or":
+            regs[dst] = a | regs[src[1]]
+        else:  # ornot
+            regs[dst] = a | ~regs[src[1]]
+    return [regs[r] for r in outputs]
+
+# -------------------- Bit-Plane Transposition --------------------
+
+
+def blocks_to_planes(blocks):
+    """(N, 8) uint8 blocks, N a multiple of 64 -> (64, N // 64) uint64 planes"""
+    n = blocks.shape[0]
+    bits = np.unpackbits(blocks, axis=1)  # (N, 64), DES bit 1 first
+    lanes = bits.T.reshape(64, n // LANES, LANES)
+    packed = np.ascontiguousarray(np.packbits(lanes, axis=2, bitorder="little"))
+    return packed.view("<u8").reshape(64, n // LANES)
+
+
+def planes_to_blocks(planes):
+    """Inverse of blocks_to_planes"""
+    words = planes.shape[1]
+    lanes = np.unpackbits(np.ascontiguousarray(planes, dtype="<u8").view(np.uint8).reshape(64, words, 8),
+                          axis=2, bitorder="little")
+    return np.packbits(lanes.reshape(64, words * LANES).T, axis=1)
+
+# -------------------- Rounds --------------------
+
+
+def key_masks(round_keys):
+    """(16, 48, 1) uint64 masks: all ones where a 48-bit round key has a 1"""
+    bits = np.array([[(k >> (47 - j)) & 1 for j in range(48)] for k in round_keys], dtype=np.uint64)
+    return (bits * ALL_ONES)[:, :, None]
+
+
+def des_planes(planes, masks):
+    """Run IP, 16 rounds and FP on (64, W) bit-planes with key_masks()"""
+    x = planes[IP_INDEX]
+    L, R = x[:32], x[32:]
+    for k in masks:
+        e = R[E_INDEX] ^ k
+        f = []
+        for i, circuit in enumerate(SBOX_CIRCUITS):
+            f.extend(eval_sbox(circuit, e[6 * i:6 * i + 6]))
+        L, R = R, L ^ np.stack(f)[P_INDEX]
+    # Undo the final swap, then FP
+    return np.concatenate((R, L))[FP_INDEX]
+
+
+def _crypt_per_block(data, schedules):
+    out = bytearray(len(data))
+    for i in range(0, len(data), 8):
+        block = int.from_bytes(data[i:i + 8], "big")
+        for round_keys in schedules:
+            block = des_crypt_block(block, round_keys)
+        out[i:i + 8] = block.to_bytes(8, "big")
+    return bytes(out)
+
+
+def _crypt(data, schedules):
+    # ECB over bytes; each schedule is the 16 round keys of one DES pass
+    if len(data) % 8:
+        raise ValueError("Data length must be a multiple of 8 bytes")
+    if len(data) // 8 < MIN_BITSLICED_BLOCKS:
+        return _crypt_per_block(data, schedules)
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 8)
+    out = np.empty_like(blocks)
+    schedules = [key_masks(round_keys) for round_keys in schedules]
+    for start in range(0, len(blocks), BATCH_BLOCKS):
+        batch = blocks[start:start + BATCH_BLOCKS]
+        count = len(batch)
+        padded = -(-count // LANES) * LANES
+        if padded != count:
+            batch = np.concatenate((batch, np.zeros((padded - count, 8), dtype=np.uint8)))
+        planes = blocks_to_planes(batch)
+        for masks in schedules:
+            planes = des_planes(planes, masks)
+        out[start:start + count] = planes_to_blocks(planes)[:count]
+    return out.tobytes()
+
+# -------------------- Byte API --------------------
+
+
+def des_encrypt_bitsliced(data, key_input):
+    """ECB-encrypt bytes (length multiple of 8); same output as DES.des_encrypt"""
+    return _crypt(data, [des_key_generation(key_input)])
+
+
+def des_decrypt_bitsliced(data, key_input):
+    """ECB-decrypt bytes (length multiple of 8); same output as DES.des_decrypt"""
+    return _crypt(data, [des_key_generation(key_input)[::-1]])
+
+
+def _triple_des_keys(key_input):
+    return [des_key_generation(f"{k:016X}") for k in parse_3des_key(key_input)]
+
+
+def triple_des_encrypt_bitsliced(data, key_input):
+    """ECB-encrypt bytes with Triple-DES EDE, staying bitsliced between passes"""
+    k1, k2, k3 = _triple_des_keys(key_input)
+    return _crypt(data, [k1, k2[::-1], k3])
+
+
+def triple_des_decrypt_bitsliced(data, key_input):
+    """ECB-decrypt bytes with Triple-DES EDE"""
+    k1, k2, k3 = _triple_des_keys(key_input)
+    return _crypt(data, [k3[::-1], k2, k1[::-1]])
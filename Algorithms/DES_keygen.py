@@ -1,4 +1,6 @@
 # -------------------- DES Key Generation --------------------
+import threading
+from collections import OrderedDict
 
 # Permutation Choice 1 (PC-1)
 PC1 = [
@@ -41,6 +43,51 @@ def left_shift(bits, n):
     """Left shift a bit string by n positions"""
     return bits[n:] + bits[:n]
 
+def int_to_bin(value, width):
+    """Render an integer as a zero-padded binary string of the given width"""
+    return format(value, f"0{width}b")
+
+# -------------------- Integer Permutation Tables --------------------
+
+def build_permutation_tables(table, in_bits):
+    """
+    Precompute byte-indexed lookup tables for a DES permutation table.
+    Entry [j][v] is the output contributed by input byte j (0 = most
+    significant) having value v, so a permutation becomes one lookup and
+    OR per input byte. Positions are 1-based from the MSB, as in the standard.
+    """
+    out_bits = len(table)
+    tables = []
+    for j in range(in_bits // 8):
+        row = [0] * 256
+        for v in range(256):
+            out = 0
+            for i, pos in enumerate(table):
+                src = pos - 1
+                if src // 8 == j and v & (0x80 >> (src % 8)):
+                    out |= 1 << (out_bits - 1 - i)
+            row[v] = out
+        tables.append(row)
+    return tables
+
+def permute_int(value, tables):
+    """Apply a permutation prepared by build_permutation_tables() to an integer"""
+    out = 0
+    shift = 8 * (len(tables) - 1)
+    for row in tables:
+        out |= row[(value >> shift) & 0xFF]
+        shift -= 8
+    return out
+
+PC1_TABLES = build_permutation_tables(PC1, 64)
+PC2_TABLES = build_permutation_tables(PC2, 56)
+
+MASK28 = (1 << 28) - 1
+
+def rotate_left28(half, n):
+    """Rotate a 28-bit half-key left by n positions"""
+    return ((half << n) | (half >> (28 - n))) & MASK28
+
 # -------------------- Key Validation --------------------
 
 def validate_des_key(input_key):
@@ -66,38 +113,123 @@ def validate_des_key(input_key):
     else:
         return None
 
-# -------------------- DES Round Key Generation --------------------
-
-def des_key_generation(key_input):
+def key_to_int(input_key):
     """
-    Generate 16 DES round keys from user input (Hex or Binary)
-    Returns list of 16 round keys as 48-bit binary strings
+    Parse a validated key (16 hex digits or 64-bit binary) into a 64-bit int
     Raises ValueError for invalid input
     """
-    key_type = validate_des_key(key_input)
+    key_type = validate_des_key(input_key)
     if key_type is None:
         raise ValueError("Invalid key! Must be 16-hex digits or 64-bit binary.")
+    return int(input_key.strip(), 16 if key_type == 'hex' else 2)
 
-    # Convert to 64-bit binary if input is hex
-    if key_type == 'hex':
-        key64 = hex_to_bin(key_input)
-    else:
-        key64 = key_input
+# -------------------- DES Round Key Generation --------------------
 
-    # Apply PC-1 to get 56-bit key
-    key56 = permute(key64, PC1)
-    C = key56[:28]
-    D = key56[28:]
+def des_round_keys(key64):
+    """
+    Generate the 16 DES round keys from a 64-bit integer key
+    Returns list of 16 round keys as 48-bit integers
+    """
+    # Apply PC-1 to get 56-bit key, split into 28-bit halves
+    key56 = permute_int(key64, PC1_TABLES)
+    C = key56 >> 28
+    D = key56 & MASK28
 
     round_keys = []
-    for i in range(16):
-        # Left shift according to SHIFT_TABLE
-        C = left_shift(C, SHIFT_TABLE[i])
-        D = left_shift(D, SHIFT_TABLE[i])
-        CD = C + D
+    for shift in SHIFT_TABLE:
+        C = rotate_left28(C, shift)
+        D = rotate_left28(D, shift)
 
         # Apply PC-2 to get 48-bit round key
-        Ki = permute(CD, PC2)
-        round_keys.append(Ki)
+        round_keys.append(permute_int((C << 28) | D, PC2_TABLES))
 
     return round_keys
+
+# -------------------- Key Schedule Cache --------------------
+
+class KeyScheduleCache:
+    """
+    Bounded, thread-safe LRU cache of round-key schedules.
+    Entries are keyed by the 64-bit key value, so the hex and binary
+    spellings of the same key share one entry.
+    """
+
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key64):
+        """Return the round keys (as a tuple) for a 64-bit int key"""
+        with self._lock:
+            round_keys = self._entries.get(key64)
+            if round_keys is not None:
+                self._entries.move_to_end(key64)
+                self.hits += 1
+                return round_keys
+            self.misses += 1
+
+        # Derive outside the lock; a concurrent miss on the same key just
+        # computes the same tuple twice
+        round_keys = tuple(des_round_keys(key64))
+        with self._lock:
+            self._entries[key64] = round_keys
+            self._entries.move_to_end(key64)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return round_keys
+
+    def evict(self, key_input):
+        """Drop one key (hex, binary or int); returns True if it was cached"""
+        key64 = key_input if isinstance(key_input, int) else key_to_int(key_input)
+        with self._lock:
+            return self._entries.pop(key64, None) is not None
+
+    def resize(self, maxsize):
+        """Change the capacity, evicting least recently used entries if needed"""
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the hit/miss counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return a snapshot of hits, misses, current size and capacity"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+# Process-wide cache used by des_key_generation() and the DES cipher
+key_schedule_cache = KeyScheduleCache()
+
+def cached_round_keys(key_input):
+    """Validate a hex/binary key and return its (cached) round keys as a tuple"""
+    return key_schedule_cache.get(key_to_int(key_input))
+
+def des_key_generation(key_input, as_binary=False):
+    """
+    Generate 16 DES round keys from user input (Hex or Binary)
+    Returns list of 16 round keys as 48-bit integers, or as 48-char
+    binary strings when as_binary=True (the form shown in the GUI)
+    Raises ValueError for invalid input
+    """
+    round_keys = cached_round_keys(key_input)
+    if as_binary:
+        return [int_to_bin(k, 48) for k in round_keys]
+    return list(round_keys)
@@ -1,45 +1,256 @@
 # ---------------- RSA logic (paper-style letters, correct decryption) ----------------
+import base64
+import functools
 import math
+import os
+import secrets
+import string
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 # ---------------- Prime helpers ----------------
-def is_prime(n):
-    if n <= 1: return False
-    if n <= 3: return True
-    if n % 2 == 0: return False
-    r = int(math.isqrt(n))
-    for i in range(3, r + 1, 2):
-        if n % i == 0: return False
+def small_primes_up_to(limit):
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit + 1, i)))
+    return [i for i in range(limit + 1) if sieve[i]]
+
+SMALL_PRIME_LIMIT = 2000
+SMALL_PRIMES = small_primes_up_to(SMALL_PRIME_LIMIT)
+SMALL_PRIME_SET = frozenset(SMALL_PRIMES)
+
+# Bases that make Miller-Rabin deterministic for every n < 3.3e24 (covers 64-bit)
+MR_DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MR_DETERMINISTIC_LIMIT = 3317044064679887385961981
+MR_ROUNDS = 40  # random bases for arbitrary larger n: error probability <= 4**-40
+
+def search_rounds(bits):
+    # Rounds for candidates drawn by a prime search rather than supplied by a
+    # caller; the average-case error for those is far below 4**-k
+    # (FIPS 186-4, Table C.2: <= 2**-100 at these sizes)
+    if bits >= 1536: return 4
+    if bits >= 1024: return 5
+    if bits >= 512: return 7
+    return MR_ROUNDS
+
+def miller_rabin(n, bases):
+    # n odd, n > 2: write n - 1 = d * 2**s
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
     return True
 
-def next_prime(x):
-    while not is_prime(x):
-        x += 1
-    return x
+def probable_prime(n, rounds=MR_ROUNDS):
+    # Miller-Rabin only; n must be odd and > SMALL_PRIME_LIMIT
+    if n < MR_DETERMINISTIC_LIMIT:
+        return miller_rabin(n, MR_DETERMINISTIC_BASES)
+    return miller_rabin(n, (secrets.randbelow(n - 3) + 2 for _ in range(rounds)))
+
+def is_prime(n, rounds=MR_ROUNDS):
+    if n <= 1: return False
+    if n <= SMALL_PRIME_LIMIT: return n in SMALL_PRIME_SET
+    for p in SMALL_PRIMES:
+        if n % p == 0: return False
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT: return True
+    return probable_prime(n, rounds)
+
+NEXT_PRIME_WINDOW = 4096
+
+def next_prime(x, on_candidate=None):
+    # on_candidate(), if given, is called before each Miller-Rabin test, so a
+    # caller can abort a long search by raising from it
+    if x <= SMALL_PRIME_LIMIT:
+        for p in SMALL_PRIMES:
+            if p >= x: return p
+    # Sieve a window [x, x + NEXT_PRIME_WINDOW) with the small primes and
+    # only run Miller-Rabin on the survivors
+    rounds = search_rounds(x.bit_length())
+    while True:
+        window = bytearray([1]) * NEXT_PRIME_WINDOW
+        for p in SMALL_PRIMES:
+            start = -x % p
+            window[start::p] = bytes(len(range(start, NEXT_PRIME_WINDOW, p)))
+        # Survivors have no small factors, so go straight to Miller-Rabin
+        for offset in range(NEXT_PRIME_WINDOW):
+            if window[offset]:
+                if on_candidate is not None:
+                    on_candidate()
+                if probable_prime(x + offset, rounds):
+                    return x + offset
+        x += NEXT_PRIME_WINDOW
 
 # ---------------- Extended Euclidean ----------------
 def egcd(a, b):
-    if a == 0: return b,0,1
-    g,x1,y1=egcd(b%a,a)
-    return g, y1-(b//a)*x1, x1
+    # Iterative: returns (g, x, y) with a*x + b*y = g, no recursion depth limit
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q*r
+        old_x, x = x, old_x - q*x
+        old_y, y = y, old_y - q*y
+    return old_r, old_x, old_y
 
 def modinv(a,m):
-    g,x,_=egcd(a,m)
-    if g!=1: raise ValueError("Inverse does not exist")
-    return x%m
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        raise ValueError("Inverse does not exist") from None
+
+def batch_modinv(values, m):
+    # Montgomery's trick: one modular inversion plus 3(N-1) multiplications
+    # for N inverses modulo the same m
+    values = list(values)
+    if not values: return []
+    prefix = [values[0] % m]
+    for v in values[1:]:
+        prefix.append(prefix[-1] * v % m)
+    inv = modinv(prefix[-1], m)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = inv * prefix[i-1] % m
+        inv = inv * values[i] % m
+    result[0] = inv
+    return result
+
+# ---------------- Private Key ----------------
+CRT_CHECK_LIMIT = 1 << 64
+
+class RSAPrivateKey(tuple):
+    """
+    Private key that still behaves as the plain (d, n) tuple, but also
+    carries the CRT parameters p, q, dP = d mod (p-1), dQ = d mod (q-1)
+    and qInv = q^-1 mod p, computed once when the key is built.
+    """
+
+    def __new__(cls, d, n, p, q):
+        if p * q != n:
+            raise ValueError("p * q does not equal n")
+        key = super().__new__(cls, (d, n))
+        key.d, key.n, key.p, key.q = d, n, p, q
+        # For p = 2, d mod (p-1) is 0 and c^0 = 1 breaks the odd residues;
+        # c^(p-1) is still congruent to c^d there (and for any other prime)
+        key.dp = d % (p - 1) or p - 1
+        key.dq = d % (q - 1) or q - 1
+        key.qinv = modinv(q, p)
+        # Toy keys (from the GUI's small p and q) are where degenerate primes
+        # turn up; check the CRT path against plain c^d mod n there
+        if n < CRT_CHECK_LIMIT:
+            for c in (0, 1, 2 % n, n - 1):
+                if crt_pow(c, key) != pow(c, d, n):
+                    raise ValueError("CRT parameters do not match (d, n)")
+        return key
+
+    def __getnewargs__(self):
+        return (self.d, self.n, self.p, self.q)
+
+def crt_pow(c, key):
+    # c^d mod n via two half-size exponentiations and Garner recombination
+    m1 = pow(c, key.dp, key.p)
+    m2 = pow(c, key.dq, key.q)
+    h = key.qinv * (m1 - m2) % key.p
+    return m2 + h * key.q
+
+def private_pow(c, private_key):
+    # CRT fast path for RSAPrivateKey, plain pow() for a bare (d, n) tuple
+    if isinstance(private_key, RSAPrivateKey):
+        return crt_pow(c, private_key)
+    d, n = private_key
+    return pow(c, d, n)
 
 # ---------------- Generate RSA Keys ----------------
-def generate_keys(p,q):
-    if not is_prime(p): p = next_prime(p)
-    if not is_prime(q): q = next_prime(q)
-    if p==q: q = next_prime(q+1)
+PUBLIC_EXPONENTS = (3, 5, 17, 257, 65537)
+
+def keys_from_primes(p, q, exponents=PUBLIC_EXPONENTS):
     n = p*q
     phi=(p-1)*(q-1)
-    for e_try in [3,5,17,257,65537]:
+    for e_try in exponents:
         if math.gcd(e_try,phi)==1:
             e=e_try
             break
+    else:
+        raise ValueError("No public exponent is coprime with phi(n)")
     d=modinv(e,phi)
-    return (e,n),(d,n)
+    return (e,n),RSAPrivateKey(d,n,p,q)
+
+def generate_keys(p,q):
+    if not is_prime(p): p = next_prime(p)
+    if not is_prime(q): q = next_prime(q)
+    if p==q: q = next_prime(q+1)
+    return keys_from_primes(p, q)
+
+# ---------------- Random Key Generation ----------------
+RANDOM_KEY_EXPONENT = 65537
+MIN_KEY_BITS = 32
+
+def random_prime(bits, e=RANDOM_KEY_EXPONENT):
+    # Random odd start with the top two bits set, so the product of two such
+    # primes has exactly 2*bits bits; p - 1 must be coprime with e
+    while True:
+        start = secrets.randbits(bits) | (3 << (bits - 2)) | 1
+        p = next_prime(start)
+        if p.bit_length() == bits and math.gcd(e, p - 1) == 1:
+            return p
+
+def _collect_primes(count, bits, workers):
+    # Yield `count` distinct random primes, searching on `workers` processes
+    if workers == 1:
+        seen = set()
+        while len(seen) < count:
+            p = random_prime(bits)
+            if p not in seen:
+                seen.add(p)
+                yield p
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = {pool.submit(random_prime, bits) for _ in range(max(workers, count))}
+        seen = set()
+        while len(seen) < count:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                p = future.result()
+                if p not in seen and len(seen) < count:
+                    seen.add(p)
+                    yield p
+                if len(seen) + len(pending) < count:
+                    pending.add(pool.submit(random_prime, bits))
+    finally:
+        # The first primes found win; drop the searches still queued
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def generate_keypairs(count, bits, workers=None):
+    """
+    Generate `count` RSA keypairs with `bits`-bit moduli from random primes.
+    p and q are searched concurrently on worker processes (workers=None uses
+    every core, workers=1 searches in-process).
+    Returns a list of ((e, n), (d, n)) tuples.
+    """
+    if bits < MIN_KEY_BITS or bits % 2:
+        raise ValueError(f"Key size must be an even number of bits >= {MIN_KEY_BITS}")
+    workers = workers or os.cpu_count() or 1
+    primes = list(_collect_primes(2 * count, bits // 2, workers))
+    return [
+        keys_from_primes(primes[i], primes[i + 1], (RANDOM_KEY_EXPONENT,))
+        for i in range(0, len(primes), 2)
+    ]
+
+def generate_random_keys(bits=2048, workers=None):
+    """Generate one RSA keypair with a `bits`-bit modulus from random primes"""
+    return generate_keypairs(1, bits, workers)[0]
 
 # ---------------- Letter Conversion ----------------
 def char_to_num(ch):
@@ -52,30 +263,80 @@ def char_to_num(ch):
 def num_to_char(num):
     return chr(num + ord('A'))
 
+# ---------------- Letter Tables ----------------
+# The letter cipher only ever exponentiates the 26 values 0-25, so each key
+# gets a translation table built once (26 modexps) and cached; messages are
+# then mapped in a single str.translate pass.
+LETTERS = string.ascii_uppercase + string.ascii_lowercase
+LETTER_TABLE_CACHE_SIZE = 64
+
+@functools.lru_cache(maxsize=LETTER_TABLE_CACHE_SIZE)
+def encrypt_table(public_key):
+    e,n = public_key
+    # wrap around only for display as letter
+    return str.maketrans({ch: num_to_char(pow(char_to_num(ch), e, n) % 26) for ch in LETTERS})
+
+@functools.lru_cache(maxsize=LETTER_TABLE_CACHE_SIZE)
+def decrypt_table(private_key):
+    return str.maketrans({ch: num_to_char(private_pow(char_to_num(ch), private_key) % 26) for ch in LETTERS})
+
+def _hashable_key(key):
+    return key if isinstance(key, tuple) else tuple(key)
+
 # ---------------- Encrypt ----------------
 def rsa_encrypt(message, public_key):
-    e,n = public_key
-    encrypted = ""
-    for ch in message:
-        num = char_to_num(ch)
-        if num is None:
-            encrypted += ch  # keep non-letters
-        else:
-            # compute m^e mod n
-            c = pow(num, e, n)
-            # wrap around only for display as letter
-            encrypted += num_to_char(c % 26)
-    return encrypted
+    # non-letters are left unchanged
+    return message.translate(encrypt_table(_hashable_key(public_key)))
 
 # ---------------- Decrypt ----------------
 def rsa_decrypt(cipher, private_key):
-    d,n = private_key
-    decrypted = ""
-    for ch in cipher:
-        num = char_to_num(ch)
-        if num is None:
-            decrypted += ch
-        else:
-            m = pow(num, d, n)
-            decrypted += num_to_char(m % 26)  # wrap around for letter display
-    return decrypted
+    return cipher.translate(decrypt_table(_hashable_key(private_key)))
+
+# ---------------- Byte Mode ----------------
+# Packs as many message bytes as fit below n into each integer block, so
+# there is one modexp per block instead of one per letter, and the message
+# round-trips exactly. Ciphertext layout: 8-byte big-endian message length,
+# then fixed-width ciphertext blocks of ceil(bits(n) / 8) bytes.
+LENGTH_HEADER_SIZE = 8
+
+def block_sizes(n):
+    plain_size = (n.bit_length() - 1) // 8   # largest block guaranteed < n
+    if plain_size < 1:
+        raise ValueError("Modulus too small for byte mode (n must exceed 256)")
+    return plain_size, (n.bit_length() + 7) // 8
+
+def rsa_encrypt_bytes(data, public_key):
+    e,n = public_key
+    plain_size, cipher_size = block_sizes(n)
+    out = bytearray(len(data).to_bytes(LENGTH_HEADER_SIZE, "big"))
+    for i in range(0, len(data), plain_size):
+        m = int.from_bytes(data[i:i + plain_size], "big")
+        out += pow(m, e, n).to_bytes(cipher_size, "big")
+    return bytes(out)
+
+def rsa_decrypt_bytes(data, private_key):
+    n = private_key[1]
+    plain_size, cipher_size = block_sizes(n)
+    if len(data) < LENGTH_HEADER_SIZE or (len(data) - LENGTH_HEADER_SIZE) % cipher_size:
+        raise ValueError("Ciphertext is truncated or not for this key")
+    length = int.from_bytes(data[:LENGTH_HEADER_SIZE], "big")
+    if (len(data) - LENGTH_HEADER_SIZE) // cipher_size != -(-length // plain_size):
+        raise ValueError("Ciphertext is truncated or not for this key")
+    out = bytearray()
+    for i in range(LENGTH_HEADER_SIZE, len(data), cipher_size):
+        m = private_pow(int.from_bytes(data[i:i + cipher_size], "big"), private_key)
+        remaining = length - len(out)
+        size = min(plain_size, remaining)
+        try:
+            out += m.to_bytes(size, "big")
+        except OverflowError:
+            # A block that does not fit its plaintext width came from another key
+            raise ValueError("Wrong key or corrupted ciphertext") from None
+    return bytes(out)
+
+def rsa_encrypt_text(message, public_key):
+    # UTF-8 text in, compact base64 ciphertext out
+    return base64.b64encode(rsa_encrypt_bytes(message.encode("utf-8"), public_key)).decode("ascii")
+
+def rsa_decrypt_text(cipher, private_key):
+    return rsa_decrypt_bytes(base64.b64decode(cipher), private_key).decode("utf-8")
@@ -0,0 +1,471 @@
+# -------------------- Key-Search Cryptanalysis --------------------
+# Brute-force solvers for the rail fence and multiplicative/affine ciphers,
+# for auditing weak legacy data. Candidates are scored with an English
+# trigram log-probability table, using NumPy over a whole block of keys at
+# once:
+#   - Text becomes codes 0..25 for letters and 26 for anything else.
+#   - A candidate decryption is a gather (rail fence) or a modular
+#     multiply (affine) on those codes.
+#   - Its score is the mean table value over its trigrams, separators included.
+# Keys are first ranked on a sample of short runs spread across the text.
+# The best few are then rescored on the whole text, and only the final top-k
+# are decrypted with the cipher's own decrypt function. Key blocks are spread
+# over worker processes. On request (stop_score) the search stops early once
+# a candidate scores as clearly English on the whole text.
+import heapq
+import math
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from Algorithms.rail_fence import rail_fence_decrypt
+from Algorithms.multiplicative import ALPHABET_SIZE, affine_decrypt
+
+SEPARATOR = ALPHABET_SIZE  # code for every non-letter
+SYMBOLS = ALPHABET_SIZE + 1
+BREAK = SYMBOLS  # marks the gap between sample runs; never scored
+TABLE_SYMBOLS = SYMBOLS + 1
+
+SAMPLE_SIZE = 512  # characters scored per key before the full rescoring
+SAMPLE_RUNS = 16  # the sample is this many equal runs spread across the text
+RESCORE_CANDIDATES = 32  # sample winners rescored on the whole text
+KEY_BLOCK = 64  # keys scored per NumPy pass (and per early-stop check)
+FULL_SCORE_WINDOW = 1 << 20  # characters per pass when scoring whole texts
+
+# Scores are mean natural-log trigram probabilities. English prose scores
+# about -7.5 to -8.0 on the whole text; the best wrong rail count or affine
+# key about -9.1 or lower. A neighbouring rail count can decrypt long
+# stretches correctly and pass this on the sample, so a sample hit only
+# stops the search once the whole text confirms it.
+ENGLISH_SCORE = -8.6
+
+# -------------------- N-gram Tables --------------------
+# English letter, bigram and trigram frequencies in percent (large-corpus
+# counts). Trigrams not listed are estimated from bigrams with a first-order
+# Markov backoff, P(abc) = P(ab) * P(bc) / P(b). Bigrams not listed are
+# estimated as BIGRAM_BACKOFF * P(a) * P(b).
+#
+# Non-letters (spaces, punctuation) are one separator symbol and are scored
+# too, so a key that scatters spaces through the text is penalised rather
+# than skipped: separators are about SEPARATOR_SHARE of the characters, and
+# two in a row (", ") about DOUBLE_SEPARATOR_SHARE. Letters next to a
+# separator follow the word-initial / word-final frequencies below.
+
+UNIGRAMS = {
+    "E": 12.49, "T": 9.28, "A": 8.04, "O": 7.64, "I": 7.57, "N": 7.23, "S": 6.51,
+    "R": 6.28, "H": 5.05, "L": 4.07, "D": 3.82, "C": 3.34, "U": 2.73, "M": 2.51,
+    "F": 2.40, "P": 2.14, "G": 1.87, "W": 1.68, "Y": 1.66, "B": 1.48, "V": 1.05,
+    "K": 0.54, "X": 0.23, "J": 0.16, "Q": 0.12, "Z": 0.09,
+}
+
+BIGRAMS = {
+    "TH": 3.56, "HE": 3.07, "IN": 2.43, "ER": 2.05, "AN": 1.99, "RE": 1.85,
+    "ON": 1.76, "AT": 1.49, "EN": 1.45, "ND": 1.35, "TI": 1.34, "ES": 1.34,
+    "OR": 1.28, "TE": 1.20, "OF": 1.17, "ED": 1.17, "IS": 1.13, "IT": 1.12,
+    "AL": 1.09, "AR": 1.07, "ST": 1.05, "TO": 1.04, "NT": 1.04, "NG": 0.95,
+    "SE": 0.93, "HA": 0.93, "AS": 0.87, "OU": 0.87, "IO": 0.83, "LE": 0.83,
+    "VE": 0.83, "CO": 0.79, "ME": 0.79, "DE": 0.76, "HI": 0.76, "RI": 0.73,
+    "RO": 0.73, "IC": 0.70, "NE": 0.69, "EA": 0.69, "RA": 0.69, "CE": 0.65,
+    "LI": 0.62, "CH": 0.60, "LL": 0.58, "BE": 0.58, "MA": 0.57, "SI": 0.55,
+    "OM": 0.55, "UR": 0.54, "CA": 0.54, "EL": 0.53, "TA": 0.53, "LA": 0.53,
+    "NS": 0.51, "DI": 0.50, "FO": 0.50, "HO": 0.49, "PE": 0.48, "EC": 0.48,
+    "PR": 0.47, "NO": 0.47, "CT": 0.46, "US": 0.45, "AC": 0.45, "OT": 0.44,
+    "IL": 0.43, "TR": 0.43, "LY": 0.43, "NC": 0.42, "ET": 0.41, "UT": 0.40,
+    "SS": 0.40, "SO": 0.40, "RS": 0.39, "UN": 0.39, "LO": 0.38, "WA": 0.38,
+    "GE": 0.38, "IE": 0.38, "WH": 0.38, "EE": 0.37, "WI": 0.37, "EM": 0.37,
+    "AD": 0.36, "OL": 0.36, "RT": 0.36, "PO": 0.35, "WE": 0.35, "NA": 0.35,
+    "UL": 0.35, "NI": 0.34, "TS": 0.34, "MO": 0.34, "OW": 0.33, "PA": 0.32,
+    "IM": 0.32, "MI": 0.32, "AI": 0.32, "SH": 0.32, "IR": 0.31, "SU": 0.31,
+    "ID": 0.30, "OS": 0.30, "IV": 0.29, "IA": 0.29, "AM": 0.28, "FI": 0.28,
+    "CI": 0.28, "VI": 0.27, "PL": 0.26, "IG": 0.25, "TU": 0.25, "EV": 0.25,
+    "LD": 0.25, "RY": 0.25, "MP": 0.24, "FE": 0.23, "BL": 0.23, "AB": 0.23,
+    "GH": 0.23, "TY": 0.23, "OP": 0.23, "WO": 0.22, "SA": 0.22, "AY": 0.22,
+    "EX": 0.21, "KE": 0.21, "FR": 0.21, "OO": 0.21, "AV": 0.20, "AG": 0.20,
+    "IF": 0.20, "AP": 0.20, "GR": 0.20, "OD": 0.20, "BO": 0.19, "SP": 0.19,
+    "RD": 0.19, "DO": 0.18, "UC": 0.18, "BU": 0.18, "EI": 0.18, "OV": 0.18,
+    "BY": 0.18, "RM": 0.18, "EP": 0.17, "TT": 0.17, "OC": 0.17, "FA": 0.17,
+    "EF": 0.16, "CU": 0.16, "RN": 0.16, "SC": 0.15, "GI": 0.15, "DA": 0.15,
+    "YO": 0.15, "CR": 0.15, "CL": 0.15, "DU": 0.15, "GA": 0.15, "QU": 0.15,
+    "UE": 0.15, "FF": 0.15, "BA": 0.15, "EY": 0.15, "LS": 0.14, "VA": 0.14,
+    "UM": 0.14, "PP": 0.14, "UA": 0.14, "UP": 0.14, "LU": 0.14, "GO": 0.14,
+    "HT": 0.13, "RU": 0.13, "UG": 0.13, "DS": 0.13, "LT": 0.13, "PI": 0.13,
+    "RC": 0.13, "RR": 0.13, "EG": 0.13, "AU": 0.12, "CK": 0.12, "EW": 0.12,
+    "MU": 0.12, "BR": 0.12, "BI": 0.11, "PT": 0.11, "AK": 0.11, "PU": 0.11,
+    "UI": 0.10, "RG": 0.10, "IB": 0.10, "TL": 0.10, "NY": 0.10, "KI": 0.10,
+    "RK": 0.10, "YS": 0.10, "OB": 0.10, "MM": 0.10, "FU": 0.10, "PH": 0.09,
+    "OG": 0.09, "MS": 0.09, "YE": 0.09, "UD": 0.09, "MB": 0.08, "IP": 0.08,
+    "UB": 0.08, "OI": 0.08, "RL": 0.08, "GU": 0.08, "DR": 0.08, "HR": 0.08,
+    "CC": 0.08, "TW": 0.08, "FT": 0.08, "WN": 0.08, "NU": 0.07, "AF": 0.07,
+    "HU": 0.07, "NN": 0.07, "EO": 0.07, "VO": 0.07, "RV": 0.07, "NF": 0.07,
+    "XP": 0.07, "GN": 0.07, "SM": 0.07, "FL": 0.07, "IZ": 0.07, "OK": 0.07,
+    "NL": 0.07, "MY": 0.06, "GL": 0.06, "AW": 0.06, "JU": 0.06, "OA": 0.06,
+    "EQ": 0.06, "SY": 0.06, "SL": 0.06, "PS": 0.06, "JO": 0.05, "LF": 0.05,
+    "NV": 0.05, "JE": 0.05, "NK": 0.05, "KN": 0.05, "GS": 0.05, "DY": 0.05,
+    "HY": 0.05, "ZE": 0.05, "KS": 0.05, "XT": 0.05, "BS": 0.05, "IK": 0.05,
+    "DD": 0.05, "CY": 0.05, "RP": 0.05, "SK": 0.05,
+}
+
+TRIGRAMS = {
+    "THE": 1.81, "AND": 0.73, "ING": 0.72, "ENT": 0.42, "ION": 0.42, "HER": 0.36,
+    "FOR": 0.34, "THA": 0.33, "NTH": 0.33, "INT": 0.32, "ERE": 0.31, "TIO": 0.31,
+    "TER": 0.30, "EST": 0.28, "ERS": 0.28, "ATI": 0.26, "HAT": 0.26, "ATE": 0.25,
+    "ALL": 0.25, "ETH": 0.24, "HES": 0.24, "VER": 0.24, "HIS": 0.24, "OFT": 0.22,
+    "ITH": 0.21, "FTH": 0.21, "STH": 0.21, "OTH": 0.21, "RES": 0.21, "ONT": 0.20,
+}
+
+WORD_INITIAL = {
+    "T": 15.9, "A": 11.7, "O": 7.6, "S": 6.7, "I": 6.4, "W": 5.5, "C": 5.2,
+    "B": 4.4, "H": 4.2, "P": 4.0, "F": 4.0, "M": 3.8, "D": 3.2, "R": 2.8,
+    "E": 2.8, "L": 2.4, "N": 2.3, "G": 1.6, "U": 1.2, "Y": 0.8, "V": 0.8,
+    "K": 0.6, "J": 0.6, "Q": 0.2, "X": 0.1, "Z": 0.1,
+}
+
+WORD_FINAL = {
+    "E": 19.2, "S": 14.4, "D": 9.2, "T": 8.6, "N": 7.9, "Y": 7.3, "R": 6.9,
+    "O": 4.7, "L": 4.5, "F": 4.1, "H": 3.7, "G": 3.0, "A": 2.4, "K": 1.2,
+    "M": 1.1, "W": 0.9, "P": 0.5, "C": 0.4, "X": 0.2, "I": 0.1, "U": 0.1,
+    "B": 0.1, "V": 0.05, "Z": 0.05, "J": 0.02, "Q": 0.02,
+}
+
+BIGRAM_BACKOFF = 0.5
+SEPARATOR_SHARE = 0.19
+DOUBLE_SEPARATOR_SHARE = 0.02
+
+
+def _distribution(table, letters):
+    p = np.array([table[ch] for ch in letters])
+    return p / p.sum()
+
+
+def build_trigram_table():
+    """
+    Return (logp, valid): float32 log-probabilities indexed by
+    a * 28**2 + b * 28 + c over letters, SEPARATOR and BREAK, and a mask of
+    the trigrams that do not touch a BREAK.
+    """
+    letters = [chr(ord("A") + i) for i in range(ALPHABET_SIZE)]
+    unigram = _distribution(UNIGRAMS, letters)
+    letter_pairs = BIGRAM_BACKOFF * np.outer(unigram, unigram)
+    for gram, pct in BIGRAMS.items():
+        letter_pairs[ord(gram[0]) - 65, ord(gram[1]) - 65] = pct / 100
+    letter_pairs /= letter_pairs.sum()
+
+    # Joint 27-symbol distributions of single characters and pairs
+    s, ss = SEPARATOR_SHARE, DOUBLE_SEPARATOR_SHARE
+    p1 = np.append((1 - s) * unigram, s)
+    p2 = np.empty((SYMBOLS, SYMBOLS))
+    p2[:ALPHABET_SIZE, :ALPHABET_SIZE] = (1 - 2 * s + ss) * letter_pairs
+    p2[:ALPHABET_SIZE, SEPARATOR] = (s - ss) * _distribution(WORD_FINAL, letters)
+    p2[SEPARATOR, :ALPHABET_SIZE] = (s - ss) * _distribution(WORD_INITIAL, letters)
+    p2[SEPARATOR, SEPARATOR] = ss
+    log1, log2 = np.log(p1), np.log(p2)
+
+    logp3 = log2[:, :, None] + log2[None, :, :] - log1[None, :, None]
+    # Listed trigrams are shares of letter-only trigrams; scale them by how
+    # often a window of three characters is all letters
+    letters_only = np.exp(logp3[:ALPHABET_SIZE, :ALPHABET_SIZE, :ALPHABET_SIZE]).sum()
+    for gram, pct in TRIGRAMS.items():
+        a, b, c = (ord(ch) - 65 for ch in gram)
+        logp3[a, b, c] = math.log(letters_only * pct / 100)
+
+    logp = np.zeros((TABLE_SYMBOLS,) * 3, dtype=np.float32)
+    logp[:SYMBOLS, :SYMBOLS, :SYMBOLS] = logp3
+    valid = np.zeros((TABLE_SYMBOLS,) * 3, dtype=bool)
+    valid[:SYMBOLS, :SYMBOLS, :SYMBOLS] = True
+    return logp.ravel(), valid.ravel()
+
+
+TRIGRAM_LOGP, TRIGRAM_VALID = build_trigram_table()
+
+# -------------------- Scoring --------------------
+
+_CODE_TABLE = np.full(256, SEPARATOR, dtype=np.uint8)
+_CODE_TABLE[ord("A"):ord("Z") + 1] = np.arange(ALPHABET_SIZE)
+_CODE_TABLE[ord("a"):ord("z") + 1] = np.arange(ALPHABET_SIZE)
+
+
+def text_codes(text):
+    """Map text (str or bytes) to codes: 0..25 for letters, 26 otherwise"""
+    if isinstance(text, str):
+        text = text.encode("latin-1", "replace")
+    return _CODE_TABLE[np.frombuffer(text, dtype=np.uint8)]
+
+
+def _trigram_sums(codes):
+    # Per row of a (K, M) code array: (sum of log-probabilities, count) over scored trigrams
+    codes = codes.astype(np.intp, copy=False)
+    tri = (codes[:, :-2] * TABLE_SYMBOLS + codes[:, 1:-1]) * TABLE_SYMBOLS + codes[:, 2:]
+    return TRIGRAM_LOGP[tri].sum(axis=1, dtype=np.float64), TRIGRAM_VALID[tri].sum(axis=1)
+
+
+def score_codes(codes):
+    """
+    Score each row of a (K, M) code array (or a single 1-D array).
+    Returns the mean trigram log-probability over trigrams not touching a
+    BREAK; rows with no such trigram get -inf.
+    """
+    codes = np.atleast_2d(codes)
+    if codes.shape[1] < 3:
+        return np.full(codes.shape[0], -np.inf)
+    total, count = _trigram_sums(codes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count > 0, total / np.maximum(count, 1), -np.inf)
+
+
+def _pad_ends(candidates):
+    # A text starts and ends at a word boundary: two SEPARATOR columns on each
+    # side score its first and last characters like any other
+    return np.pad(candidates, ((0, 0), (2, 2)), constant_values=SEPARATOR)
+
+
+def _edge_windows(head, tail):
+    # The padded ends of a whole text, given its first and last two codes
+    return [np.concatenate(([SEPARATOR, SEPARATOR], head)), np.concatenate((tail, [SEPARATOR, SEPARATOR]))]
+
+
+def _score_windows(windows):
+    # Mean over an iterable of 1-D code windows that overlap by two codes
+    # (plus the _edge_windows of the text)
+    total, count = 0.0, 0
+    for window in windows:
+        if len(window) >= 3:
+            t, c = _trigram_sums(window[None, :])
+            total += float(t[0])
+            count += int(c[0])
+    return total / count if count else -math.inf
+
+
+def _windows(n):
+    # [start, stop) ranges covering n codes in FULL_SCORE_WINDOW steps, overlapping by two
+    return [(start, min(start + FULL_SCORE_WINDOW + 2, n)) for start in range(0, max(n - 2, 1), FULL_SCORE_WINDOW)]
+
+
+def score_text(text):
+    """Score a whole text, FULL_SCORE_WINDOW characters at a time"""
+    codes = text_codes(text)
+    windows = [codes[start:stop] for start, stop in _windows(len(codes))]
+    return _score_windows(windows + _edge_windows(codes[:2], codes[-2:]))
+
+def sample_positions(n, sample=SAMPLE_SIZE):
+    """
+    Plaintext positions scored per key, and the column indices where one run
+    ends and the next begins. The runs cover the whole text, so a key that
+    is only right near the start (a neighbouring rail count whose cycle is
+    longer than the sample) does not rank with the right one.
+    """
+    if n <= sample:
+        return np.arange(n, dtype=np.int64), np.empty(0, dtype=np.int64)
+    run = sample // SAMPLE_RUNS
+    starts = np.linspace(0, n - run, SAMPLE_RUNS).astype(np.int64)
+    positions = (starts[:, None] + np.arange(run, dtype=np.int64)).ravel()
+    return positions, np.arange(1, SAMPLE_RUNS, dtype=np.int64) * run
+
+
+def _split_runs(candidates, breaks):
+    # BREAK columns between runs, so no trigram spans two of them
+    return np.insert(candidates, breaks, BREAK, axis=1) if len(breaks) else candidates
+
+# -------------------- Candidate Generators --------------------
+# Each returns a (len(keys), len(positions)) array: the plaintext codes at
+# the given positions for every key, decrypted directly from the codes.
+
+
+def rail_fence_candidates(codes, rails, positions):
+    """
+    Plaintext codes at `positions` for every rail count in `rails`, with no
+    full decryption. Plaintext position i lies at offset t = i % cycle in its
+    zigzag period, on rail k = min(t, cycle - t). Its ciphertext index is the
+    number of positions on rails above k plus its index within rail k.
+    """
+    n = len(codes)
+    r = np.asarray(rails, dtype=np.int64)[:, None]
+    i = np.asarray(positions, dtype=np.int64)[None, :]
+    cycle = 2 * (r - 1)
+    j, t = i // cycle, i % cycle
+    k = np.where(t < r, t, cycle - t)
+    within = np.where((k == 0) | (k == r - 1), j, 2 * j + (t >= r))
+    # positions p < n on rails < k: residues t < k and t > cycle - k
+    full, rem = n // cycle, n % cycle
+    above = full * k + np.minimum(rem, k)
+    above += np.where(k > 0, full * (k - 1) + np.maximum(0, rem - (cycle - k + 1)), 0)
+    return codes[above + within]
+
+
+def affine_candidates(codes, keys, positions):
+    """Plaintext codes at `positions` for every (a, b) in `keys`"""
+    c = codes[positions].astype(np.int64)[None, :]
+    keys = np.asarray(keys, dtype=np.int64).reshape(-1, 2)
+    a_inv = np.array([pow(int(a), -1, ALPHABET_SIZE) for a in keys[:, 0]])[:, None]
+    plain = (a_inv * (c - keys[:, 1:2])) % ALPHABET_SIZE
+    return np.where(c == SEPARATOR, SEPARATOR, plain)
+
+
+_GENERATORS = {
+    "rail_fence": rail_fence_candidates,
+    "affine": affine_candidates,
+}
+
+# -------------------- Parallel Search --------------------
+# Worker processes receive the ciphertext codes once through the pool
+# initializer; tasks then only carry key lists. A shared Event tells every
+# worker to stop when any of them finds a candidate that is clearly English
+# on the whole text.
+
+_worker_state = {}
+
+
+def _init_worker(codes, stop_event):
+    _worker_state["codes"] = codes
+    _worker_state["stop"] = stop_event
+
+
+def _score_keys(kind, keys, sample, keep, stop_score, codes=None, stop_event=None):
+    """Score `keys` block by block; returns the `keep` best (score, key) pairs"""
+    if codes is None:
+        codes, stop_event = _worker_state["codes"], _worker_state["stop"]
+    generate = _GENERATORS[kind]
+    positions, breaks = sample_positions(len(codes), sample)
+    best = []
+    for start in range(0, len(keys), KEY_BLOCK):
+        if stop_event is not None and stop_event.is_set():
+            break
+        block = keys[start:start + KEY_BLOCK]
+        scores = score_codes(_pad_ends(_split_runs(generate(codes, block, positions), breaks))).tolist()
+        best = heapq.nlargest(keep, best + list(zip(scores, block)))
+        if stop_score is not None and _confirmed(kind, codes, scores, block, stop_score):
+            if stop_event is not None:
+                stop_event.set()
+            break
+    return best
+
+
+def _confirmed(kind, codes, scores, block, stop_score):
+    # Sample hits in this block, checked on the whole text before stopping
+    return any(full_score(kind, codes, key) >= stop_score
+               for score, key in zip(scores, block) if score >= stop_score)
+
+
+def _chunks(keys, count):
+    size = -(-len(keys) // count)
+    return [keys[i:i + size] for i in range(0, len(keys), size)]
+
+
+def search(kind, codes, keys, sample=SAMPLE_SIZE, keep=RESCORE_CANDIDATES,
+           stop_score=ENGLISH_SCORE, workers=None):
+    """
+    Rank `keys` on `sample` characters spread across the text.
+    Returns up to `keep` (sample_score, key) pairs, best first.
+    workers=None uses every core; workers=1 searches in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(keys) <= KEY_BLOCK:
+        return _score_keys(kind, keys, sample, keep, stop_score, codes)
+
+    context = multiprocessing.get_context()
+    stop_event = context.Event()
+    # Several chunks per worker so an early stop leaves little queued work
+    chunks = _chunks(keys, workers * 4)
+    best = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(codes, stop_event)) as pool:
+        pending = {pool.submit(_score_keys, kind, chunk, sample, keep, stop_score) for chunk in chunks}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                best = heapq.nlargest(keep, best + future.result())
+            if stop_event.is_set():
+                for future in pending:
+                    future.cancel()
+                best = heapq.nlargest(keep, best + [p for f in pending if not f.cancelled() for p in f.result()])
+                break
+    return best
+
+
+def full_score(kind, codes, key):
+    """Score one key on the whole text, window by window, without decrypting it"""
+    generate = _GENERATORS[kind]
+    n = len(codes)
+    windows = [generate(codes, [key], np.arange(start, stop))[0] for start, stop in _windows(n)]
+    edges = generate(codes, [key], np.r_[0:min(2, n), max(n - 2, 0):n])[0]
+    return _score_windows(windows + _edge_windows(edges[:min(2, n)], edges[min(2, n):]))
+
+
+def _rescore(kind, codes, candidates, decrypt, top_k, neighbours=None):
+    """
+    Whole-text scores for the sample winners; only the top_k are decrypted.
+    With neighbours(key) -> keys, each of the top_k then climbs to the best
+    whole-text score among its neighbours until none is better.
+    """
+    scores = {key: full_score(kind, codes, key) for _, key in candidates}
+    if neighbours is not None:
+        for key in sorted(scores, key=scores.get, reverse=True)[:top_k]:
+            while True:
+                for k in neighbours(key):
+                    if k not in scores:
+                        scores[k] = full_score(kind, codes, k)
+                best = max(neighbours(key), key=scores.get, default=key)
+                if scores[best] <= scores[key]:
+                    break
+                key = best
+    ranked = sorted(scores, key=scores.get, reverse=True)[:top_k]
+    return [(scores[key], key, decrypt(key)) for key in ranked]
+
+# -------------------- Solvers --------------------
+# Near the right rail count, a neighbouring count moves only a few characters,
+# often none inside the sample, so many neighbours tie there. The whole-text
+# score still tells them apart, so the winners climb over this many counts
+# on each side.
+RAIL_NEIGHBOURHOOD = 8
+
+
+def solve_rail_fence(ciphertext, top_k=5, max_rails=None, workers=None, stop_score=None):
+    """
+    Try every rail count from 2 to len - 1 (or max_rails).
+    Returns up to top_k (score, rails, plaintext) tuples, best first.
+    By default the whole key space is ranked. With stop_score (for example
+    ENGLISH_SCORE) the search stops at the first count whose whole-text
+    score reaches it, which is much faster on long texts but may settle on
+    a neighbouring count that decrypts most of the text correctly.
+    """
+    n = len(ciphertext)
+    last = n - 1 if max_rails is None else min(max_rails, n - 1)
+    keys = list(range(2, last + 1))
+    if not keys:
+        return [(score_text(ciphertext), 1, ciphertext)]
+    codes = text_codes(ciphertext)
+    candidates = search("rail_fence", codes, keys, keep=max(top_k, RESCORE_CANDIDATES),
+                        stop_score=stop_score, workers=workers)
+    def neighbours(rails):
+        return range(max(2, rails - RAIL_NEIGHBOURHOOD), min(last, rails + RAIL_NEIGHBOURHOOD) + 1)
+
+    return _rescore("rail_fence", codes, candidates, lambda rails: rail_fence_decrypt(ciphertext, rails), top_k,
+                    neighbours)
+
+
+def solve_affine(ciphertext, top_k=5, workers=1, stop_score=None):
+    """
+    Try all 312 affine keys (a, b) with gcd(a, 26) = 1.
+    Returns up to top_k (score, (a, b), plaintext) tuples, best first.
+    The key space is small, so the default is a full in-process ranking.
+    """
+    keys = [(a, b) for a in range(1, ALPHABET_SIZE) if math.gcd(a, ALPHABET_SIZE) == 1
+            for b in range(ALPHABET_SIZE)]
+    codes = text_codes(ciphertext)
+    candidates = search("affine", codes, keys, keep=max(top_k, RESCORE_CANDIDATES),
+                        stop_score=stop_score, workers=workers)
+    return _rescore("affine", codes, candidates, lambda key: affine_decrypt(ciphertext, *key), top_k)
+
+
+def solve_multiplicative(ciphertext, top_k=5, workers=1, stop_score=None):
+    """
+    Try all 12 multiplicative keys a with gcd(a, 26) = 1.
+    Returns up to top_k (score, a, plaintext) tuples, best first.
+    """
+    keys = [(a, 0) for a in range(1, ALPHABET_SIZE) if math.gcd(a, ALPHABET_SIZE) == 1]
+    codes = text_codes(ciphertext)
+    candidates = search("affine", codes, keys, keep=max(top_k, RESCORE_CANDIDATES),
+                        stop_score=stop_score, workers=workers)
+    return [(score, key[0], plaintext) for score, key, plaintext in
+            _rescore("affine", codes, candidates, lambda key: affine_decrypt(ciphertext, *key), top_k)]
@@ -0,0 +1,273 @@
+# -------------------- Per-Operation Instrumentation --------------------
+# Records, per (algorithm, phase), call counts, bytes processed and a
+# wall-time histogram, with optional cProfile and tracemalloc captures.
+# The registry wraps every encrypt/decrypt call and the GUI wraps key
+# generation, so the numbers show which algorithm and which phase (keygen
+# vs. bulk transform) the time goes to, without an external profiler.
+#
+#     from Algorithms.instrumentation import instruments
+#     instruments.enable_profiling("RSA")
+#     ...
+#     print(instruments.dump_json())
+#     print(instruments.profile_report("RSA", "keygen"))
+#
+# Setting CRYPTO_STATS_FILE writes the JSON dump there at exit;
+# CRYPTO_PROFILE=1 (or a comma-separated list of algorithm names) and
+# CRYPTO_TRACEMALLOC=1 turn the captures on (see configure_from_env).
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the wall-time histogram buckets; one more bucket
+# counts everything slower than the last bound
+HISTOGRAM_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+
+def payload_size(value):
+    """Length of a message/result for the byte counters (characters for str)"""
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+class Operation:
+    """One measured call; nbytes may be updated inside the `with` block"""
+
+    __slots__ = ("algorithm", "phase", "nbytes", "seconds", "error", "peak_memory")
+
+    def __init__(self, algorithm, phase, nbytes=0):
+        self.algorithm = algorithm
+        self.phase = phase
+        self.nbytes = nbytes
+        self.seconds = 0.0
+        self.error = None
+        self.peak_memory = None
+
+    @property
+    def throughput(self):
+        """Bytes per second, or None for calls without a payload"""
+        if not self.nbytes or not self.seconds:
+            return None
+        return self.nbytes / self.seconds
+
+    def as_dict(self):
+        return {
+            "algorithm": self.algorithm,
+            "phase": self.phase,
+            "bytes": self.nbytes,
+            "seconds": self.seconds,
+            "bytes_per_sec": self.throughput,
+            "error": self.error,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class PhaseStats:
+    """Aggregated counters for one (algorithm, phase)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total_seconds = 0.0
+        self.min_seconds = None
+        self.max_seconds = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.peak_memory = None
+        self.profile = None  # pstats.Stats accumulated over profiled calls
+
+    def add(self, op):
+        self.calls += 1
+        self.errors += op.error is not None
+        self.bytes += op.nbytes
+        self.total_seconds += op.seconds
+        self.min_seconds = op.seconds if self.min_seconds is None else min(self.min_seconds, op.seconds)
+        self.max_seconds = max(self.max_seconds, op.seconds)
+        self.histogram[bisect_left(HISTOGRAM_BOUNDS, op.seconds)] += 1
+        if op.peak_memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, op.peak_memory)
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else None,
+            "min_seconds": self.min_seconds,
+            "max_seconds": self.max_seconds,
+            "bytes_per_sec": self.bytes / self.total_seconds if self.bytes and self.total_seconds else None,
+            "histogram": {"bounds": list(HISTOGRAM_BOUNDS), "counts": list(self.histogram)},
+            "peak_memory": self.peak_memory,
+            "profiled": self.profile is not None,
+        }
+
+
+class Instrumentation:
+    """
+    Thread-safe collector. measure() is cheap when profiling and tracemalloc
+    are off: two perf_counter() calls and a locked counter update.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._last = None
+        self.enabled = True
+        self._profile_algorithms = set()  # names, or {None} for all
+        self._profile_busy = False  # cProfile allows one active profiler at a time
+        self._tracemalloc = False
+
+    # ---------------- Configuration ----------------
+    def enable_profiling(self, *algorithms):
+        """Capture cProfile stats for these algorithms (all when none given)"""
+        with self._lock:
+            self._profile_algorithms.update(algorithms or (None,))
+
+    def disable_profiling(self):
+        with self._lock:
+            self._profile_algorithms.clear()
+
+    def enable_tracemalloc(self):
+        """Record the peak traced memory of every call (slows calls noticeably)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._tracemalloc = True
+
+    def disable_tracemalloc(self):
+        self._tracemalloc = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _should_profile(self, algorithm):
+        return None in self._profile_algorithms or algorithm in self._profile_algorithms
+
+    # ---------------- Measurement ----------------
+    @contextmanager
+    def measure(self, algorithm, phase, nbytes=0):
+        """
+        Time the block as one `phase` call of `algorithm`.
+        Yields the Operation, whose nbytes the block may set.
+        """
+        op = Operation(algorithm, phase, nbytes)
+        if not self.enabled:
+            yield op
+            return
+
+        profiler = None
+        if self._profile_algorithms and self._should_profile(algorithm):
+            with self._lock:
+                if not self._profile_busy:
+                    self._profile_busy = True
+                    profiler = cProfile.Profile()
+        trace = self._tracemalloc and tracemalloc.is_tracing()
+        if trace:
+            # The peak is process-wide, so concurrent calls share it
+            tracemalloc.reset_peak()
+
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:  # another profiler is already active
+                profiler = None
+                self._profile_busy = False
+        start = time.perf_counter()
+        try:
+            yield op
+        except BaseException as e:
+            op.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            op.seconds = time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+            if trace:
+                op.peak_memory = tracemalloc.get_traced_memory()[1]
+            self._record(op, profiler)
+
+    def _record(self, op, profiler):
+        with self._lock:
+            stats = self._stats.get((op.algorithm, op.phase))
+            if stats is None:
+                stats = self._stats[(op.algorithm, op.phase)] = PhaseStats()
+            stats.add(op)
+            if profiler is not None:
+                self._profile_busy = False
+                if stats.profile is None:
+                    stats.profile = pstats.Stats(profiler)
+                else:
+                    stats.profile.add(profiler)
+            self._last = op
+
+    # ---------------- Reporting ----------------
+    @property
+    def last(self):
+        """The most recently finished Operation, or None"""
+        return self._last
+
+    def stats(self, algorithm=None):
+        """{(algorithm, phase): counters dict}, optionally for one algorithm"""
+        with self._lock:
+            return {
+                key: s.as_dict() for key, s in self._stats.items()
+                if algorithm is None or key[0] == algorithm
+            }
+
+    def snapshot(self):
+        """Nested {algorithm: {phase: counters}} plus the last operation"""
+        result = {}
+        for (algorithm, phase), counters in self.stats().items():
+            result.setdefault(algorithm, {})[phase] = counters
+        last = self._last
+        return {"algorithms": result, "last": last.as_dict() if last else None}
+
+    def dump_json(self, path=None):
+        """Return the snapshot as JSON, also writing it to `path` if given"""
+        text = json.dumps(self.snapshot(), indent=2, sort_keys=True)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def profile_report(self, algorithm, phase, limit=25, sort="cumulative"):
+        """pstats text for the profiled calls of (algorithm, phase), or None"""
+        with self._lock:
+            stats = self._stats.get((algorithm, phase))
+            profile = stats.profile if stats else None
+            if profile is None:
+                return None
+            out = io.StringIO()
+            profile.stream = out
+            profile.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._last = None
+
+
+instruments = Instrumentation()
+
+
+def configure_from_env(environ=os.environ):
+    """Apply CRYPTO_PROFILE, CRYPTO_TRACEMALLOC and CRYPTO_STATS_FILE"""
+    profile = environ.get("CRYPTO_PROFILE", "").strip()
+    if profile in ("1", "all", "true"):
+        instruments.enable_profiling()
+    elif profile and profile != "0":
+        instruments.enable_profiling(*(name.strip() for name in profile.split(",")))
+    if environ.get("CRYPTO_TRACEMALLOC", "") not in ("", "0"):
+        instruments.enable_tracemalloc()
+    stats_file = environ.get("CRYPTO_STATS_FILE")
+    if stats_file:
+        atexit.register(instruments.dump_json, stats_file)
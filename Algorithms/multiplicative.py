@@ -0,0 +1,102 @@
+import math
+import string
+from functools import lru_cache
+
+ALPHABET_SIZE = 26
+TABLE_CACHE_SIZE = 64
+
+# Letters keep their case; anything else passes through unchanged.
+# str and bytes inputs are both supported (bytes: ASCII letters only).
+
+
+def validate_multiplicative_key(a: int) -> int:
+
+    a = int(a)
+    if math.gcd(a, ALPHABET_SIZE) != 1:
+        raise ValueError(f"Key must be coprime with {ALPHABET_SIZE} (e.g. 1, 3, 5, 7, 9, 11, ...)")
+    return a % ALPHABET_SIZE
+
+
+def _letter_map(scale: int, shift: int) -> dict:
+
+    # letter x -> letter (scale * (x + shift)) mod 26, in both cases
+    mapping = {}
+    for alphabet in (string.ascii_uppercase, string.ascii_lowercase):
+        for x, ch in enumerate(alphabet):
+            mapping[ch] = alphabet[scale * (x + shift) % ALPHABET_SIZE]
+    return mapping
+
+
+def _bytes_table(mapping: dict) -> bytes:
+    return bytes.maketrans("".join(mapping).encode("ascii"), "".join(mapping.values()).encode("ascii"))
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def affine_tables(a: int, b: int = 0):
+
+    # Built once per key: (str encrypt, str decrypt, bytes encrypt, bytes decrypt).
+    # The modular inverse is computed here and never again for this key.
+    a = validate_multiplicative_key(a)
+    b = int(b) % ALPHABET_SIZE
+    a_inv = pow(a, -1, ALPHABET_SIZE)
+
+    # E(x) = a*x + b = a * (x + a^-1 * b),  D(y) = a^-1 * (y - b)
+    forward = _letter_map(a, a_inv * b)
+    backward = _letter_map(a_inv, -b)
+    return (
+        str.maketrans(forward),
+        str.maketrans(backward),
+        _bytes_table(forward),
+        _bytes_table(backward),
+    )
+
+
+def _translate(text, a: int, b: int, decrypt: bool):
+    enc_str, dec_str, enc_bytes, dec_bytes = affine_tables(a, b)
+    if isinstance(text, str):
+        return text.translate(dec_str if decrypt else enc_str)
+    return bytes(text).translate(dec_bytes if decrypt else enc_bytes)
+
+
+# -------------------- Affine --------------------
+
+
+def affine_encrypt(plaintext, a: int, b: int):
+    return _translate(plaintext, a, b, decrypt=False)
+
+
+def affine_decrypt(ciphertext, a: int, b: int):
+    return _translate(ciphertext, a, b, decrypt=True)
+
+
+# -------------------- Multiplicative (affine with b = 0) --------------------
+
+
+def multiplicative_encrypt(plaintext, key: int):
+    return _translate(plaintext, key, 0, decrypt=False)
+
+
+def multiplicative_decrypt(ciphertext, key: int):
+    return _translate(ciphertext, key, 0, decrypt=True)
+
+
+# -------------------- Batch --------------------
+
+
+def affine_encrypt_batch(messages, a: int, b: int = 0) -> list:
+
+    # The tables are built once per key and cached; each message is then one
+    # C-level translate (plus a cache hit on the tables)
+    return [_translate(m, a, b, decrypt=False) for m in messages]
+
+
+def affine_decrypt_batch(messages, a: int, b: int = 0) -> list:
+    return [_translate(m, a, b, decrypt=True) for m in messages]
+
+
+def multiplicative_encrypt_batch(messages, key: int) -> list:
+    return affine_encrypt_batch(messages, key, 0)
+
+
+def multiplicative_decrypt_batch(messages, key: int) -> list:
+    return affine_decrypt_batch(messages, key, 0)
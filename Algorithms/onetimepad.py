@@ -1,3 +1,7 @@
+import mmap
+import os
+
+
 def onetimepad_encrypt(message: str, key: str) -> str:
 
     extended_key = (key * ((len(message) // len(key)) + 1))[: len(message)]
@@ -7,4 +11,86 @@ def onetimepad_encrypt(message: str, key: str) -> str:
 def onetimepad_decrypt(ciphertext: str, key: str) -> str:
 
     extended_key = (key * ((len(ciphertext) // len(key)) + 1))[: len(ciphertext)]
-    return "".join(str(int(c) ^ int(k)) for c, k in zip(ciphertext, extended_key))
\ No newline at end of file
+    return "".join(str(int(c) ^ int(k)) for c, k in zip(ciphertext, extended_key))
+
+# -------------------- Bytes Mode --------------------
+# Works on any bytes-like object (bytes, bytearray, memoryview, mmap) and
+# XORs whole buffers as big integers in C, without building a repeated key.
+# A true one-time pad must be at least as long as the message.
+
+XOR_WINDOW = 1 << 20  # bytes per window for the in-place variant
+
+
+def _byte_view(buffer) -> memoryview:
+    # Flat unsigned-byte view, so lengths count bytes for array('I'),
+    # multi-dimensional or non-byte-format memoryviews too
+    return memoryview(buffer).cast("B")
+
+
+def _check_pad(length: int, pad) -> None:
+    if len(pad) < length:
+        raise ValueError("One-time pad is shorter than the message")
+
+
+def onetimepad_xor(data, pad) -> bytes:
+
+    data, pad = _byte_view(data), _byte_view(pad)
+    n = len(data)
+    _check_pad(n, pad)
+    pad = pad[:n]
+    return (int.from_bytes(data, "little") ^ int.from_bytes(pad, "little")).to_bytes(n, "little")
+
+
+def onetimepad_xor_into(out, data, pad) -> int:
+
+    # Writes data XOR pad into the caller's writable buffer `out` (which may
+    # be `data` itself) window by window, so no full-size temporary is made.
+    out, data, pad = _byte_view(out), _byte_view(data), _byte_view(pad)
+    n = len(data)
+    _check_pad(n, pad)
+    if len(out) < n:
+        raise ValueError("Output buffer is shorter than the message")
+    for start in range(0, n, XOR_WINDOW):
+        end = min(start + XOR_WINDOW, n)
+        x = int.from_bytes(data[start:end], "little") ^ int.from_bytes(pad[start:end], "little")
+        out[start:end] = x.to_bytes(end - start, "little")
+    return n
+
+
+# XOR is its own inverse
+onetimepad_encrypt_bytes = onetimepad_xor
+onetimepad_decrypt_bytes = onetimepad_xor
+
+
+# -------------------- File Mode --------------------
+# Memory-maps the input, the pad and a pre-sized output file one window at a
+# time, so memory stays constant whatever the file size.
+
+# 64 MiB, rounded to the mmap offset alignment
+FILE_WINDOW = (64 << 20) // mmap.ALLOCATIONGRANULARITY * mmap.ALLOCATIONGRANULARITY
+
+
+def onetimepad_xor_file(src_path, pad_path, dst_path, window: int = FILE_WINDOW) -> int:
+
+    if window <= 0 or window % mmap.ALLOCATIONGRANULARITY:
+        raise ValueError("Window must be a positive multiple of mmap.ALLOCATIONGRANULARITY")
+    # Opening dst with "w+b" would truncate src or pad if it were the same file
+    if os.path.exists(dst_path) and any(os.path.samefile(dst_path, p) for p in (src_path, pad_path)):
+        raise ValueError("Output file must differ from the input and pad files")
+    size = os.path.getsize(src_path)
+    if os.path.getsize(pad_path) < size:
+        raise ValueError("One-time pad is shorter than the message")
+
+    with open(src_path, "rb") as src, open(pad_path, "rb") as pad, open(dst_path, "w+b") as dst:
+        dst.truncate(size)
+        for offset in range(0, size, window):
+            length = min(window, size - offset)
+            with mmap.mmap(src.fileno(), length, offset=offset, access=mmap.ACCESS_READ) as src_map, \
+                 mmap.mmap(pad.fileno(), length, offset=offset, access=mmap.ACCESS_READ) as pad_map, \
+                 mmap.mmap(dst.fileno(), length, offset=offset, access=mmap.ACCESS_WRITE) as dst_map:
+                onetimepad_xor_into(dst_map, src_map, pad_map)
+    return size
+
+
+onetimepad_encrypt_file = onetimepad_xor_file
+onetimepad_decrypt_file = onetimepad_xor_file
@@ -1,62 +1,246 @@
+import os
+import shutil
+from functools import lru_cache
+from operator import itemgetter
+
+# Number of (length, rails) permutations kept; each holds two index tuples
+PERMUTATION_CACHE_SIZE = 32
+# Only texts up to this length (a default record) use the cached gathers:
+# an entry costs about 80 bytes per character, so longer one-off messages
+# are transposed with slices instead
+GATHER_MAX_LENGTH = 1 << 16
+
+
+def rail_fence_permutation(length: int, rails: int) -> list:
+
+    # Closed form of the zigzag: with cycle = 2 * (rails - 1), rail 0 holds
+    # positions 0, cycle, 2*cycle, ...; middle rail k alternates between
+    # j*cycle + k and j*cycle + cycle - k; the last rail holds rails - 1 + j*cycle.
+    # Returns the plaintext index for every ciphertext position.
+    cycle = 2 * (rails - 1)
+    order = list(range(0, length, cycle))
+
+    for k in range(1, rails - 1):
+        down = range(k, length, cycle)
+        up = range(cycle - k, length, cycle)
+        merged = [0] * (len(down) + len(up))
+        merged[::2] = down
+        merged[1::2] = up
+        order.extend(merged)
+
+    order.extend(range(rails - 1, length, cycle))
+    return order
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def rail_fence_gathers(length: int, rails: int):
+
+    # Cached (encrypt, decrypt) gathers for texts of this length
+    # (at most GATHER_MAX_LENGTH; see _transpose)
+    order = rail_fence_permutation(length, rails)
+    inverse = [0] * length
+    for position, index in enumerate(order):
+        inverse[index] = position
+    return itemgetter(*order), itemgetter(*inverse)
+
+
+def _transpose_slices(text, rails: int, decrypt: bool) -> list:
+
+    # Uncached transposition: rail k is text[k::cycle] interleaved with
+    # text[cycle - k::cycle], moved with extended-slice assignments on one
+    # list of characters (or byte values)
+    length = len(text)
+    cycle = 2 * (rails - 1)
+    out = [None] * length
+    pos = 0
+    for k in range(rails):
+        down = range(k, length, cycle)
+        up = range(cycle - k, length, cycle) if 0 < k < rails - 1 else range(0)
+        end = pos + len(down) + len(up)
+        if decrypt:
+            out[k::cycle] = text[pos:end:2] if up else text[pos:end]
+            if up:
+                out[cycle - k::cycle] = text[pos + 1:end:2]
+        else:
+            out[pos:end:2 if up else 1] = text[k::cycle]
+            if up:
+                out[pos + 1:end:2] = text[cycle - k::cycle]
+        pos = end
+    return out
+
+
+def _transpose(text, rails: int, decrypt: bool):
+
+    # Gather list/tuple of the transposed text; cached for short texts
+    if len(text) <= GATHER_MAX_LENGTH:
+        return rail_fence_gathers(len(text), rails)[decrypt](text)
+    return _transpose_slices(text, rails, decrypt)
+
+
 def rail_fence_encrypt(plaintext: str, rails: int) -> str:
     if rails <= 1 or rails >= len(plaintext):
         return plaintext
 
-    # Use list of strings (Unicode safe)
-    fence = [""] * rails
+    return "".join(_transpose(plaintext, rails, decrypt=False))
 
-    row = 0
-    direction = 1
 
-    for char in plaintext:
-        fence[row] += char
+def rail_fence_decrypt(ciphertext: str, rails: int) -> str:
+    if rails <= 1 or rails >= len(ciphertext):
+        return ciphertext
 
-        # Switch direction
-        if row == 0:
-            direction = 1
-        elif row == rails - 1:
-            direction = -1
+    return "".join(_transpose(ciphertext, rails, decrypt=True))
 
-        row += direction
 
-    return "".join(fence)
+# -------------------- Streaming: Fixed-Size Records --------------------
+# Each record is transposed on its own (its own zigzag period), so a stream
+# of any length is processed one record at a time. Works on str or bytes.
 
+DEFAULT_RECORD_SIZE = 1 << 16
 
-def rail_fence_decrypt(ciphertext: str, rails: int) -> str:
-    if rails <= 1 or rails >= len(ciphertext):
-        return ciphertext
 
-    n = len(ciphertext)
+def _records(chunks, record_size: int):
+
+    # Re-cut an iterable of str/bytes chunks into record_size pieces
+    pending = None
+    for chunk in chunks:
+        pending = chunk if pending is None else pending + chunk
+        if len(pending) >= record_size:
+            cut = len(pending) - len(pending) % record_size
+            for start in range(0, cut, record_size):
+                yield pending[start : start + record_size]
+            pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def _transform_records(chunks, rails: int, record_size: int, which: int):
+    if record_size <= 0:
+        raise ValueError("record_size must be positive")
+    for record in _records(chunks, record_size):
+        if rails <= 1 or rails >= len(record):
+            yield record
+            continue
+        out = _transpose(record, rails, decrypt=bool(which))
+        yield bytes(out) if isinstance(record, (bytes, bytearray)) else "".join(out)
+
+
+def rail_fence_encrypt_records(chunks, rails: int, record_size: int = DEFAULT_RECORD_SIZE):
+    return _transform_records(chunks, rails, record_size, 0)
+
+
+def rail_fence_decrypt_records(chunks, rails: int, record_size: int = DEFAULT_RECORD_SIZE):
+    return _transform_records(chunks, rails, record_size, 1)
+
+
+def iter_chunks(stream, size: int = DEFAULT_RECORD_SIZE):
+
+    # Read a file object (text or binary) in pieces
+    return iter(lambda: stream.read(size), stream.read(0))
+
+
+# -------------------- Streaming: Whole File --------------------
+# Transposes a whole binary file as one message without holding the rails
+# in memory. Within rail k the characters keep their input order, so the
+# part of rail k that falls in one input chunk is a contiguous run of the
+# output whose offset follows from counting rail-k positions arithmetically.
+# Offsets are in bytes, so this mode works on binary files.
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _count_below(x: int, residue: int, cycle: int) -> int:
+
+    # How many positions p < x have p % cycle == residue
+    return (x - residue + cycle - 1) // cycle if x > residue else 0
+
+
+def _rail_residues(rails: int, k: int):
+    cycle = 2 * (rails - 1)
+    return (k,) if k in (0, rails - 1) else (k, cycle - k)
+
+
+def _rail_count(x: int, rails: int, k: int) -> int:
+    cycle = 2 * (rails - 1)
+    return sum(_count_below(x, residue, cycle) for residue in _rail_residues(rails, k))
+
+
+def _rail_slices(base: int, length: int, rails: int, k: int):
+
+    # Slices of chunk [base, base + length) on rail k, ordered so that rail
+    # order interleaves them: first[0], second[0], first[1], ...
+    cycle = 2 * (rails - 1)
+    return sorted(
+        (slice((residue - base) % cycle, length, cycle) for residue in _rail_residues(rails, k)),
+        key=lambda s: s.start,
+    )
+
+
+def _interleave(first, second):
+    merged = bytearray(len(first) + len(second))
+    merged[::2] = first
+    merged[1::2] = second
+    return merged
+
+
+def _rail_starts(size: int, rails: int):
+    starts, offset = [], 0
+    for k in range(rails):
+        starts.append(offset)
+        offset += _rail_count(size, rails, k)
+    return starts
+
 
-    # Step 1: Build zigzag pattern (store row index only)
-    pattern = []
-    row = 0
-    direction = 1
+def _check_file_args(src_path, dst_path, chunk_size: int) -> None:
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    # Opening dst for writing would truncate src if it were the same file
+    if os.path.exists(dst_path) and os.path.samefile(dst_path, src_path):
+        raise ValueError("Output file must differ from the input file")
 
-    for _ in range(n):
-        pattern.append(row)
-        if row == 0:
-            direction = 1
-        elif row == rails - 1:
-            direction = -1
-        row += direction
 
-    # Step 2: Count characters expected in each row
-    row_counts = [pattern.count(r) for r in range(rails)]
+def rail_fence_encrypt_file(src_path, dst_path, rails: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    _check_file_args(src_path, dst_path, chunk_size)
+    size = os.path.getsize(src_path)
+    with open(src_path, "rb") as src, open(dst_path, "w+b") as dst:
+        if rails <= 1 or rails >= size:
+            shutil.copyfileobj(src, dst)
+            return size
 
-    # Step 3: Split ciphertext into rails
-    rails_list = []
-    index = 0
-    for count in row_counts:
-        rails_list.append(list(ciphertext[index : index + count]))
-        index += count
+        dst.truncate(size)
+        starts = _rail_starts(size, rails)
+        base = 0
+        while base < size:
+            chunk = src.read(chunk_size)
+            for k in range(rails):
+                parts = [chunk[s] for s in _rail_slices(base, len(chunk), rails, k)]
+                run = parts[0] if len(parts) == 1 else _interleave(*parts)
+                dst.seek(starts[k] + _rail_count(base, rails, k))
+                dst.write(run)
+            base += len(chunk)
+    return size
 
-    # Step 4: Rebuild plaintext following zigzag pattern
-    result = []
-    rail_positions = [0] * rails
 
-    for r in pattern:
-        result.append(rails_list[r][rail_positions[r]])
-        rail_positions[r] += 1
+def rail_fence_decrypt_file(src_path, dst_path, rails: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    _check_file_args(src_path, dst_path, chunk_size)
+    size = os.path.getsize(src_path)
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        if rails <= 1 or rails >= size:
+            shutil.copyfileobj(src, dst)
+            return size
 
-    return "".join(result)
\ No newline at end of file
+        starts = _rail_starts(size, rails)
+        for base in range(0, size, chunk_size):
+            length = min(chunk_size, size - base)
+            chunk = bytearray(length)
+            for k in range(rails):
+                first = _rail_count(base, rails, k)
+                src.seek(starts[k] + first)
+                run = src.read(_rail_count(base + length, rails, k) - first)
+                slices = _rail_slices(base, length, rails, k)
+                if len(slices) == 1:
+                    chunk[slices[0]] = run
+                else:
+                    chunk[slices[0]] = run[::2]
+                    chunk[slices[1]] = run[1::2]
+            dst.write(chunk)
+    return size
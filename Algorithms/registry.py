@@ -0,0 +1,144 @@
+# -------------------- Algorithm Registry --------------------
+# Each algorithm declares its display name, the module that implements it,
+# its encrypt/decrypt entry points, the inputs it needs and the buttons it
+# shows. Modules are imported on first use, so importing the registry (and
+# starting the GUI) loads none of them, and dispatch is a dict lookup.
+# Every encrypt/decrypt call is timed by the instrumentation layer.
+import importlib
+
+from Algorithms.instrumentation import instruments, payload_size
+
+
+class InputError(ValueError):
+    """Invalid user input; the message is meant to be shown as-is"""
+
+
+class Algorithm:
+    """
+    fields:  inputs the algorithm uses ("message", "key", "primes")
+    buttons: actions it offers ("encrypt", "decrypt", "generate_rsa", "generate_des")
+    check:   optional check(message, key) -> key, run before encrypt/decrypt;
+             raises InputError for bad input and may convert the key
+    """
+
+    def __init__(self, name, module, encrypt=None, decrypt=None, check=None,
+                 fields=("message", "key"), buttons=("encrypt", "decrypt"),
+                 encrypt_label="Encrypt", takes_key=True):
+        self.name = name
+        self.module_name = module
+        self.encrypt_name = encrypt
+        self.decrypt_name = decrypt
+        self.check = check
+        self.fields = fields
+        self.buttons = buttons
+        self.encrypt_label = encrypt_label
+        self.takes_key = takes_key
+        self._module = None
+
+    def load(self):
+        """Import the implementing module (once) and return it"""
+        if self._module is None:
+            self._module = importlib.import_module(self.module_name)
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def function(self, attr):
+        return getattr(self.load(), attr)
+
+    def measure(self, phase, nbytes=0):
+        """Context manager timing one `phase` call (e.g. "keygen") of this algorithm"""
+        return instruments.measure(self.name, phase, nbytes)
+
+    def _run(self, phase, attr, message, key):
+        if attr is None:
+            raise InputError(f"{self.name} does not support this operation")
+        if self.check is not None:
+            key = self.check(message, key)
+        fn = self.function(attr)
+        with self.measure(phase, payload_size(message)):
+            return fn(message, key) if self.takes_key else fn(message)
+
+    def encrypt(self, message, key=None):
+        return self._run("encrypt", self.encrypt_name, message, key)
+
+    def decrypt(self, message, key=None):
+        return self._run("decrypt", self.decrypt_name, message, key)
+
+
+# -------------------- Input Checks --------------------
+
+def _rails(message, key):
+    rails = int(key)
+    if rails <= 1 or rails > len(message):
+        raise InputError("Key must be between 2 and message length")
+    return rails
+
+
+def _otp(message, key):
+    if message == "":
+        raise InputError("⚠️ Enter a message first!")
+    if key == "":
+        raise InputError("⚠️ Enter a key for OTP!")
+    return key
+
+
+def _rsa(message, key):
+    if key is None:
+        raise InputError("⚠️ Generate RSA keys first!")
+    if message == "":
+        raise InputError("⚠️ Enter a message first!")
+    return key
+
+
+def _aes_block(message, key):
+    if len(message.strip()) != 32:
+        raise InputError("Enter 32 hex characters (16 bytes)!")
+    return key
+
+
+# -------------------- Registry --------------------
+
+ALGORITHMS = {}
+
+
+def register(algorithm):
+    ALGORITHMS[algorithm.name] = algorithm
+    return algorithm
+
+
+def get_algorithm(name):
+    try:
+        return ALGORITHMS[name]
+    except KeyError:
+        raise KeyError(f"Unknown algorithm: {name}") from None
+
+
+register(Algorithm(
+    "Multiplicative", "Algorithms.multiplicative",
+    encrypt="multiplicative_encrypt", decrypt="multiplicative_decrypt",
+))
+register(Algorithm(
+    "One Time Pad", "Algorithms.onetimepad",
+    encrypt="onetimepad_encrypt", decrypt="onetimepad_decrypt", check=_otp,
+))
+register(Algorithm(
+    "Rail Fence", "Algorithms.rail_fence",
+    encrypt="rail_fence_encrypt", decrypt="rail_fence_decrypt", check=_rails,
+))
+register(Algorithm(
+    "RSA", "Algorithms.RSA",
+    encrypt="rsa_encrypt", decrypt="rsa_decrypt", check=_rsa,
+    fields=("message", "primes"), buttons=("generate_rsa", "encrypt", "decrypt"),
+))
+register(Algorithm(
+    "AES", "Algorithms.AES_shiftrow",
+    encrypt="sub_bytes_shift_rows_hex", check=_aes_block, takes_key=False,
+    fields=("message",), buttons=("encrypt",), encrypt_label="Shift Row",
+))
+register(Algorithm(
+    "DES", "Algorithms.DES_keygen",
+    fields=("key",), buttons=("generate_des",),
+))
@@ -12,17 +12,121 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QListView,
     QTextEdit,
+    QProgressBar,
 )
 from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import QStackedWidget
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QPalette, QColor
 import sys
-from Algorithms.rail_fence import rail_fence_encrypt, rail_fence_decrypt
-from Algorithms.DES_keygen import des_key_generation, validate_des_key
-from Algorithms.onetimepad import onetimepad_encrypt, onetimepad_decrypt
-from Algorithms.RSA import generate_keys, rsa_encrypt, rsa_decrypt
+from Algorithms.instrumentation import configure_from_env, instruments
+from Algorithms.registry import ALGORITHMS, InputError, get_algorithm
+
+
+# ---------------------------- BACKGROUND WORKER ----------------------------
+class TaskSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class TaskCancelled(Exception):
+    """Raised from a cancelled task's progress callback to unwind the worker"""
+
+
+class Task(QRunnable):
+    """
+    Runs fn(*args) on a QThreadPool thread and reports back through signals,
+    which Qt delivers on the GUI thread. With reports_progress=True, fn is
+    also called with a `progress` keyword: a callback taking a 0-100
+    percentage, which raises TaskCancelled once the task is cancelled so
+    the worker stops at its next report and frees its pool thread.
+    """
+
+    def __init__(self, fn, *args, reports_progress=False):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.reports_progress = reports_progress
+        self.cancelled = False
+        self.signals = TaskSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def report_progress(self, percent):
+        if self.cancelled:
+            raise TaskCancelled()
+        self.signals.progress.emit(percent)
+
+    def run(self):
+        if self.cancelled:
+            return
+        kwargs = {"progress": self.report_progress} if self.reports_progress else {}
+        try:
+            result = self.fn(*self.args, **kwargs)
+        except TaskCancelled:
+            return
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(f"Error: {str(e)}")
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(result)
+
+
+# ---------------------------- WORKER FUNCTIONS ----------------------------
+# Pure functions run off the GUI thread: they only see the values captured
+# when the button was clicked and return the text for result_box.
+def run_algorithm(method, action, msg, key):
+    # action is "encrypt" or "decrypt"; the algorithm module is imported on first use
+    try:
+        return getattr(get_algorithm(method), action)(msg, key)
+    except InputError as e:
+        return str(e)
+    except Exception as e:
+        return f"Invalid Key or Error: {str(e)}"
+
+
+def des_round_keys_text(key):
+    des = get_algorithm("DES")
+    with des.measure("keygen"):
+        keys = des.function("des_key_generation")(key, as_binary=True)
+    text = "🔑 Round Keys:\n"
+    for i, k in enumerate(keys, start=1):
+        text += f"Round {i}: {k}\n"
+    return text
+
+
+def rsa_keys_from_inputs(p, q, progress):
+    # Prime search is the slow part for large p/q, so report after each prime
+    algorithm = get_algorithm("RSA")
+    rsa = algorithm.load()
+    is_prime, next_prime, generate_keys = rsa.is_prime, rsa.next_prime, rsa.generate_keys
+    with algorithm.measure("keygen"):
+        # on_candidate re-reports the current percentage before each primality
+        # test, so a cancelled search stops mid-way instead of running to the end
+        if not is_prime(p): p = next_prime(p, on_candidate=lambda: progress(0))
+        progress(45)
+        if not is_prime(q): q = next_prime(q, on_candidate=lambda: progress(45))
+        progress(90)
+        keys = generate_keys(p, q)
+    progress(100)
+    return keys
+
+
+def format_operation(op):
+    # Status line for the last measured operation
+    if op is None:
+        return ""
+    ms = op.seconds * 1e3
+    text = f"{op.algorithm} {op.phase}: {ms:.1f} ms" if ms >= 1 else f"{op.algorithm} {op.phase}: {ms:.3f} ms"
+    if op.throughput:
+        text += f" · {op.nbytes} B · {op.throughput / 1e6:.2f} MB/s"
+    if op.error:
+        text += " (failed)"
+    return text
 
 
 # ---------------------------- UI CLASS ----------------------------
@@ -32,6 +136,9 @@ class EncryptionUI(QWidget):
         self.setWindowTitle("Encryption/ Decryption Tool")
         self.rsa_public_key = None
         self.rsa_private_key = None
+        self.thread_pool = QThreadPool.globalInstance()
+        self._task = None
+        self._last_operation = None
 
 
         # --- Theme Definitions ---
@@ -104,9 +211,7 @@ class EncryptionUI(QWidget):
         sec_key = create_section("Key", self.key_input, 1)
 
         self.method_box = QComboBox()
-        self.method_box.addItems(
-            ["Multiplicative", "One Time Pad", "Rail Fence", "RSA", "AES", "DES"]
-        )
+        self.method_box.addItems(list(ALGORITHMS))
         list_view = QListView()
         list_view.setStyleSheet(
             
@@ -179,6 +284,21 @@ class EncryptionUI(QWidget):
         self.frames[5].hide()            # Prime q مخفي افتراضياً
         self.btn_generate_rsa.hide()     # زر Generate RSA مخفي افتراضياً
 
+        # --- Background task status ---
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(8)
+        self.progress_bar.hide()
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setFixedHeight(35)
+        self.btn_cancel.clicked.connect(self.cancel_task)
+        self.btn_cancel.hide()
+
+        # --- Status bar: time and throughput of the last operation ---
+        self.status_label = QLabel("")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: #CBD5E1; font-size: 12px;")
+
 # ترتيب إضافة العناصر للواجهة
         main_layout.addWidget(sec_method)
         main_layout.addWidget(sec_msg)
@@ -190,7 +310,10 @@ class EncryptionUI(QWidget):
         main_layout.addWidget(self.btn_encrypt)
         main_layout.addWidget(self.btn_decrypt)
         main_layout.addWidget(self.btn_generate_des)
+        main_layout.addWidget(self.progress_bar)
+        main_layout.addWidget(self.btn_cancel)
         main_layout.addStretch(1)
+        main_layout.addWidget(self.status_label)
 
 
         self.setLayout(main_layout)
@@ -264,41 +387,76 @@ class EncryptionUI(QWidget):
         )
         self.apply_theme(self.current_theme)
 
+    # ---------------- BACKGROUND TASKS ----------------
+    def run_task(self, fn, on_result, *args, reports_progress=False):
+        # Run fn(*args) on the thread pool; on_result(result) is called back on
+        # the GUI thread. Starting a new task cancels the one still running.
+        self.cancel_task()
+        task = Task(fn, *args, reports_progress=reports_progress)
+        task.signals.finished.connect(lambda result, t=task: self._task_finished(t, on_result, result))
+        task.signals.failed.connect(lambda message, t=task: self._task_failed(t, message))
+        task.signals.progress.connect(self.progress_bar.setValue)
+        self._task = task
+        self._last_operation = instruments.last
+        self.set_busy(True)
+        # Tasks without progress reports show a busy indicator instead
+        self.progress_bar.setRange(0, 100 if reports_progress else 0)
+        self.thread_pool.start(task)
+
+    def cancel_task(self):
+        # Tasks with progress reports stop at their next report; any other
+        # running call cannot be interrupted, so its result is dropped instead
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self.set_busy(False)
+
+    def _task_finished(self, task, on_result, result):
+        if task is not self._task:
+            return
+        self._task = None
+        self.set_busy(False)
+        self.update_status()
+        on_result(result)
+
+    def _task_failed(self, task, message):
+        if task is not self._task:
+            return
+        self._task = None
+        self.set_busy(False)
+        self.update_status()
+        self.result_box.setText(message)
+
+    def update_status(self):
+        # Cleared when the task stopped before reaching a measured call (bad input)
+        op = instruments.last
+        self.status_label.setText("" if op is self._last_operation else format_operation(op))
+
+    def set_busy(self, busy):
+        for b in (self.btn_encrypt, self.btn_decrypt, self.btn_generate_des, self.btn_generate_rsa):
+            b.setEnabled(not busy)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(busy)
+        self.btn_cancel.setVisible(busy)
+
+    def show_result(self, text):
+        self.result_box.setText(text)
+        self.result_box.moveCursor(QTextCursor.Start)  # Scroll to top
+
     # ---------------- ACTIONS ----------------
-    # ---------------- Rail Fence ----------------
+    # ---------------- eccrypt & decrypt ----------------
     def encrypt_action(self):
         msg = self.message_input.text()
-        key = self.key_input.text()
         method = self.method_box.currentText()
-        try:
-            if method == "Rail Fence":
-                rails = int(key)
-                if rails <= 1 or rails > len(msg):
-                    output = "Key must be between 2 and message length"
-                else:
-                    output = rail_fence_encrypt(msg, rails)
-            else:
-                output = "Not Implemented"
-            self.result_box.setText(output)
-        except Exception:
-            self.result_box.setText("Invalid Key")
+        key = self.rsa_public_key if "primes" in get_algorithm(method).fields else self.key_input.text()
+        self.run_task(run_algorithm, self.show_result, method, "encrypt", msg, key)
 
     def decrypt_action(self):
         msg = self.result_box.toPlainText()
-        key = self.key_input.text()
         method = self.method_box.currentText()
-        try:
-            if method == "Rail Fence":
-                rails = int(key)
-                if rails <= 1 or rails > len(msg):
-                    output = "Key must be between 2 and message length"
-                else:
-                    output = rail_fence_decrypt(msg, rails)
-            else:
-                output = "Not Implemented"
-            self.result_box.setText(output)
-        except Exception:
-            self.result_box.setText("Invalid Key")
+        key = self.rsa_private_key if "primes" in get_algorithm(method).fields else self.key_input.text()
+        self.run_task(run_algorithm, self.show_result, method, "decrypt", msg, key)
+
 
     def method_changed(self, method):
     # مسح كل الحقول عند تغيير الطريقة
@@ -306,47 +464,24 @@ class EncryptionUI(QWidget):
         self.key_input.clear()
         self.result_box.clear()
 
-    # ---------------- DES ----------------
-        if method == "DES":
-           self.message_input.hide() 
-           self.frames[1].show()
-           self.frames[0].hide()           # Frame الرسالة
-           self.btn_encrypt.hide()
-           self.btn_decrypt.hide()
-           self.btn_generate_des.show()
-           self.frames[4].hide()           # Prime p
-           self.frames[5].hide()           # Prime q
-           self.btn_generate_rsa.hide()
-
-    # ---------------- RSA ----------------
-        elif method == "RSA":
-           self.message_input.show()
-           self.message_input.setReadOnly(False)
-           self.frames[0].show()
-       
-           self.frames[4].show()           # Prime p
-           self.frames[5].show()           # Prime q
-           self.frames[1].hide()           # Key input غير مستخدم
-           self.btn_generate_rsa.show()
-           self.btn_encrypt.show()
-           self.btn_decrypt.show()
-           self.btn_generate_des.hide()
-
-    # ---------------- Other methods ----------------
-        else:
-           self.message_input.show()
-           self.message_input.setReadOnly(False)  # السماح بالكتابة
-           self.frames[0].show()
-           self.frames[1].show()           # Key
-           self.frames[4].hide()           # Prime p
-           self.frames[5].hide()           # Prime q
-           self.btn_generate_rsa.hide()
-           self.btn_generate_des.hide()
-           self.btn_encrypt.show()
-           self.btn_decrypt.show()
-
-
-    
+        # First selection imports the algorithm's module
+        algorithm = get_algorithm(method)
+        algorithm.load()
+
+        fields, buttons = algorithm.fields, algorithm.buttons
+        self.frames[0].setVisible("message" in fields)     # Frame الرسالة
+        self.message_input.setVisible("message" in fields)
+        self.message_input.setReadOnly(False)              # السماح بالكتابة
+        self.frames[1].setVisible("key" in fields)         # Key
+        self.key_input.setVisible("key" in fields)
+        self.frames[4].setVisible("primes" in fields)      # Prime p
+        self.frames[5].setVisible("primes" in fields)      # Prime q
+
+        self.btn_encrypt.setText(algorithm.encrypt_label)
+        self.btn_encrypt.setVisible("encrypt" in buttons)
+        self.btn_decrypt.setVisible("decrypt" in buttons)
+        self.btn_generate_rsa.setVisible("generate_rsa" in buttons)
+        self.btn_generate_des.setVisible("generate_des" in buttons)
 
     def generate_des_keys(self):
         key = self.key_input.text().strip()
@@ -354,250 +489,43 @@ class EncryptionUI(QWidget):
         if not key:
             self.result_box.setText("Please enter a DES key!")
             return
-        if validate_des_key(key) is None:
+        if get_algorithm("DES").function("validate_des_key")(key) is None:
             self.result_box.setText(
                 "Invalid DES key! Must be 16 hex digits or 64-bit binary."
             )
             return
-        try:
-            keys = des_key_generation(key)
-        except Exception as e:
-            self.result_box.setText(f"Error: {str(e)}")
-            return
-        text = "🔑 Round Keys:\n"
-        for i, k in enumerate(keys, start=1):
-            text += f"Round {i}: {k}\n"
-        self.result_box.setText(text)
-        self.result_box.moveCursor(QTextCursor.Start)  # Scroll to top
-# -------------------- AES S-box & helpers --------------------
-s_box = [
-    [0x63,0x7c,0x77,0x7b,0xf2,0x6b,0x6f,0xc5,0x30,0x01,0x67,0x2b,0xfe,0xd7,0xab,0x76],
-    [0xca,0x82,0xc9,0x7d,0xfa,0x59,0x47,0xf0,0xad,0xd4,0xa2,0xaf,0x9c,0xa4,0x72,0xc0],
-    [0xb7,0xfd,0x93,0x26,0x36,0x3f,0xf7,0xcc,0x34,0xa5,0xe5,0xf1,0x71,0xd8,0x31,0x15],
-    [0x04,0xc7,0x23,0xc3,0x18,0x96,0x05,0x9a,0x07,0x12,0x80,0xe2,0xeb,0x27,0xb2,0x75],
-    [0x09,0x83,0x2c,0x1a,0x1b,0x6e,0x5a,0xa0,0x52,0x3b,0xd6,0xb3,0x29,0xe3,0x2f,0x84],
-    [0x53,0xd1,0x00,0xed,0x20,0xfc,0xb1,0x5b,0x6a,0xcb,0xbe,0x39,0x4a,0x4c,0x58,0xcf],
-    [0xd0,0xef,0xaa,0xfb,0x43,0x4d,0x33,0x85,0x45,0xf9,0x02,0x7f,0x50,0x3c,0x9f,0xa8],
-    [0x51,0xa3,0x40,0x8f,0x92,0x9d,0x38,0xf5,0xbc,0xb6,0xda,0x21,0x10,0xff,0xf3,0xd2],
-    [0xcd,0x0c,0x13,0xec,0x5f,0x97,0x44,0x17,0xc4,0xa7,0x7e,0x3d,0x64,0x5d,0x19,0x73],
-    [0x60,0x81,0x4f,0xdc,0x22,0x2a,0x90,0x88,0x46,0xee,0xb8,0x14,0xde,0x5e,0x0b,0xdb],
-    [0xe0,0x32,0x3a,0x0a,0x49,0x06,0x24,0x5c,0xc2,0xd3,0xac,0x62,0x91,0x95,0xe4,0x79],
-    [0xe7,0xc8,0x37,0x6d,0x8d,0xd5,0x4e,0xa9,0x6c,0x56,0xf4,0xea,0x65,0x7a,0xae,0x08],
-    [0xba,0x78,0x25,0x2e,0x1c,0xa6,0xb4,0xc6,0xe8,0xdd,0x74,0x1f,0x4b,0xbd,0x8b,0x8a],
-    [0x70,0x3e,0xb5,0x66,0x48,0x03,0xf6,0x0e,0x61,0x35,0x57,0xb9,0x86,0xc1,0x1d,0x9e],
-    [0xe1,0xf8,0x98,0x11,0x69,0xd9,0x8e,0x94,0x9b,0x1e,0x87,0xe9,0xce,0x55,0x28,0xdf],
-    [0x8c,0xa1,0x89,0x0d,0xbf,0xe6,0x42,0x68,0x41,0x99,0x2d,0x0f,0xb0,0x54,0xbb,0x16]
-]
-
-def hex_to_bytes(hex_str):
-    return [int(hex_str[i:i+2],16) for i in range(0,len(hex_str),2)]
-
-def block_to_state(block):
-    state = [[0]*4 for _ in range(4)]
-    for i in range(16):
-        row = i % 4
-        col = i // 4
-        state[row][col] = block[i]
-    return state
-
-def sub_bytes(state):
-    for i in range(4):
-        for j in range(4):
-            byte = state[i][j]
-            state[i][j] = s_box[byte>>4][byte&0x0F]
-    return state
-
-def shift_rows(state):
-    new_state = [row[:] for row in state]
-    for i in range(1,4):
-        new_state[i] = state[i][i:] + state[i][:i]
-    return new_state
-
-def state_to_hex_string(state):
-    return ' '.join([f"{b:02X}" for row in state for b in row])
-
-# -------------------- Modify EncryptionUI for AES --------------------
-original_encrypt_action = EncryptionUI.encrypt_action
-original_method_changed = EncryptionUI.method_changed
-
-def new_method_changed(self, method):
-    original_method_changed(self, method)
-    if method == "AES":
-        self.btn_encrypt.setText("Shift Row")
-    else:
-        self.btn_encrypt.setText("Encrypt")
-
-def new_encrypt_action(self):
-    method = self.method_box.currentText()
-    if method == "AES":
-        msg = self.message_input.text().strip()
-        self.result_box.clear()
-        if len(msg) != 32:
-            self.result_box.setText("Enter 32 hex characters (16 bytes)!")
-            return
-        try:
-            block = hex_to_bytes(msg)
-            state = block_to_state(block)
-            state = sub_bytes(state)
-            state = shift_rows(state)
-            self.result_box.setText(state_to_hex_string(state))
-        except Exception as e:
-            self.result_box.setText(f"Error: {str(e)}")
-    else:
-        original_encrypt_action(self)
-
-EncryptionUI.method_changed = new_method_changed
-EncryptionUI.encrypt_action = new_encrypt_action
-# --------- Extra patch: hide Key field for AES ----------
-old_method_changed = EncryptionUI.method_changed
-
-def newer_method_changed(self, method):
-    old_method_changed(self, method)
-
-    if method == "AES":
-        # اخفاء حقل الـ Key اطار + الإدخال
-        self.frames[1].hide()
-        self.key_input.hide()
-    else:
-        # اظهارهم في باقي الخوارزميات
-        self.frames[1].show()
-        self.key_input.show()
-def newer_method_changed(self, method):
-    old_method_changed(self, method)
-
-    if method == "AES":
-        # اخفاء حقل الـ Key اطار + الإدخال
-        self.frames[1].hide()
-        self.key_input.hide()
-        # اخفاء زرار Decrypt
-        self.btn_decrypt.hide()
-    else:
-        # اظهارهم في باقي الخوارزميات
-        self.frames[1].show()
-        self.key_input.show()
-        self.btn_decrypt.show()  # خلي زرار Decrypt يرجع يظهر
-
-EncryptionUI.method_changed = newer_method_changed
-
-    
+        self.run_task(des_round_keys_text, self.show_result, key)
+
     def generate_rsa_keys(self):
         self.result_box.clear()
         try:
             p = int(self.p_input.text())
             q = int(self.q_input.text())
         except ValueError:
-           self.result_box.setText("⚠️ Enter valid integers for p and q!")
-           return
+            self.result_box.setText("⚠️ Enter valid integers for p and q!")
+            return
+        self.run_task(rsa_keys_from_inputs, self.rsa_keys_ready, p, q, reports_progress=True)
 
-        try:
-        # استدعاء الدالة generate_keys من كود RSA
-            public_key, private_key = generate_keys(p, q)
-            e, n = public_key
-            d, n_private = private_key
+    def rsa_keys_ready(self, keys):
+        public_key, private_key = keys
+        e, n = public_key
+        d, n_private = private_key
 
         # حفظ المفاتيح في المتغيرات الخاصة بالكلاس لاستخدامها لاحقًا
-            self.rsa_public_key = public_key
-            self.rsa_private_key = private_key
+        self.rsa_public_key = public_key
+        self.rsa_private_key = private_key
 
         # إنشاء نص العرض للمفاتيح
-            text = (
+        self.show_result(
             f"🔑 RSA Keys Generated:\n\n"
             f"Public Key (e, n): ({e}, {n})\n"
             f"Private Key (d, n): ({d}, {n_private})"
         )
 
-        # عرض النص في صندوق النتيجة
-            self.result_box.setText(text)
-            self.result_box.moveCursor(QTextCursor.Start)  # الرجوع للبداية
-        except Exception as ex:
-            self.result_box.setText(f"Error generating keys: {str(ex)}")
- 
-
-
-        
-
-
-
-    # ---------------- eccrypt & decrypt ----------------
-    def encrypt_action(self):
-       msg = self.message_input.text()
-       key = self.key_input.text()
-       method = self.method_box.currentText()
-       try:
-        if method == "Rail Fence":
-            rails = int(key)
-            if rails <= 1 or rails > len(msg):
-                output = "Key must be between 2 and message length"
-            else:
-                output = rail_fence_encrypt(msg, rails)
-
-        elif method == "One Time Pad":
-            if msg == "":
-                output = "⚠️ Enter a message first!"
-            elif key == "":
-                output = "⚠️ Enter a key for OTP!"
-            else:
-                output = onetimepad_encrypt(msg, key)
-
-        elif method == "RSA":
-            if not hasattr(self, "rsa_public_key"):
-                output = "⚠️ Generate RSA keys first!"
-            elif msg == "":
-                output = "⚠️ Enter a message first!"
-            else:
-                output = rsa_encrypt(msg, self.rsa_public_key)
-
-        else:
-            output = "Not Implemented"
-
-        self.result_box.setText(output)
-       except Exception as e:
-        self.result_box.setText(f"Invalid Key or Error: {str(e)}")
-
-
-    def decrypt_action(self):
-       msg = self.result_box.toPlainText()
-       key = self.key_input.text()
-       method = self.method_box.currentText()
-       try:
-        if method == "Rail Fence":
-            rails = int(key)
-            if rails <= 1 or rails > len(msg):
-                output = "Key must be between 2 and message length"
-            else:
-                output = rail_fence_decrypt(msg, rails)
-
-        elif method == "One Time Pad":
-            if msg == "":
-                output = "⚠️ Enter a message first!"
-            elif key == "":
-                output = "⚠️ Enter a key for OTP!"
-            else:
-                output = onetimepad_decrypt(msg, key)
-
-        elif method == "RSA":
-            if not hasattr(self, "rsa_private_key"):
-                output = "⚠️ Generate RSA keys first!"
-            elif msg == "":
-                output = "⚠️ Enter a message first!"
-            else:
-                output = rsa_decrypt(msg, self.rsa_private_key)
-
-        else:
-            output = "Not Implemented"
-
-        self.result_box.setText(output)
-       except Exception as e:
-        self.result_box.setText(f"Invalid Key or Error: {str(e)}")
-
-
-    # ---------------- AES ----------------
-    # ---------------- Multiplicative ----------------
-  
-
 
 # ---------------- MAIN ----------------
 if __name__ == "__main__":
+    configure_from_env()
     app = QApplication(sys.argv)
     window = EncryptionUI()
     window.show()
@@ -0,0 +1,461 @@
+"""
+Benchmark suite for the algorithms in Algorithms/, with JSON regression baselines.
+
+Measures latency (seconds per call) and throughput (MB/s) of every entry point
+the GUI and cli.py use, across input sizes and key sizes:
+
+    python benchmark.py                          # run and print
+    python benchmark.py --save                   # run and record benchmark_baseline.json
+    python benchmark.py --compare                # run and fail (exit 1) on a slowdown
+    python benchmark.py --compare --max-slowdown 0.10 --sizes 1K,1M,100M -k rail
+
+Each case is timed best-of-N (at least --repeat calls and --min-time seconds),
+and the best time is compared with the baseline. A case is a regression when
+it is more than --max-slowdown (default 25%) slower. Pure-Python per-character
+paths have a size cap, so the default run finishes in minutes. Pass --no-cap to
+run them at every size. Baselines are machine-specific; record one per machine.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DEFAULT_SIZES = "1K,64K,1M"
+DEFAULT_MAX_SLOWDOWN = 0.25
+UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+# ---------------------------- HELPERS ----------------------------
+def parse_size(text):
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def format_size(size):
+    for unit in ("G", "M", "K"):
+        if size >= UNITS[unit] and size % UNITS[unit] == 0:
+            return f"{size // UNITS[unit]}{unit}"
+    return str(size)
+
+
+def letters(size):
+    # Deterministic mixed-case text with spaces, like a GUI message
+    base = "The Quick Brown Fox Jumps Over The Lazy Dog "
+    return (base * (size // len(base) + 1))[:size]
+
+
+def digits(size):
+    return ("3141592653589793238462643383279" * (size // 31 + 1))[:size]
+
+
+def random_bytes(size):
+    return os.urandom(size)
+
+
+def time_call(fn, repeat, min_time):
+    # Best-of-N timing; keeps calling until both repeat and min_time are met
+    times = []
+    started = time.perf_counter()
+    while len(times) < repeat or time.perf_counter() - started < min_time:
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), statistics.median(times), len(times)
+
+
+# ---------------------------- CASES ----------------------------
+# A case is (name, params, size, setup) where setup() returns the callable to
+# time. size is the number of input bytes per call (0 for pure latency cases).
+# Expensive inputs (keys, permutation tables) are built in setup, not timed.
+class Case:
+    def __init__(self, name, setup, size=0, params=""):
+        self.name = name
+        self.setup = setup
+        self.size = size
+        self.params = params
+
+    @property
+    def id(self):
+        parts = [self.name]
+        if self.params:
+            parts.append(self.params)
+        if self.size:
+            parts.append(format_size(self.size))
+        return "/".join(parts)
+
+
+def rail_fence_cases(sizes, cap):
+    from Algorithms import rail_fence
+    for size in sizes:
+        if size > cap(16 << 20):
+            continue
+        for rails in (3, 17):
+            def enc(size=size, rails=rails):
+                text = letters(size)
+                rail_fence.rail_fence_gathers(size, rails)  # warm the permutation cache
+                return lambda: rail_fence.rail_fence_encrypt(text, rails)
+
+            def dec(size=size, rails=rails):
+                text = rail_fence.rail_fence_encrypt(letters(size), rails)
+                return lambda: rail_fence.rail_fence_decrypt(text, rails)
+
+            yield Case("rail_fence_encrypt", enc, size, f"rails={rails}")
+            yield Case("rail_fence_decrypt", dec, size, f"rails={rails}")
+
+        def records(size=size):
+            data = random_bytes(size)
+            return lambda: b"".join(rail_fence.rail_fence_encrypt_records([data], 5))
+        yield Case("rail_fence_encrypt_records", records, size, "rails=5")
+
+
+def rail_fence_file_cases(sizes, workdir):
+    from Algorithms import rail_fence
+    for size in sizes:
+        def setup(size=size):
+            src = _write_file(workdir, f"rf_{size}", size)
+            dst = os.path.join(workdir, "rf_out")
+            return lambda: rail_fence.rail_fence_encrypt_file(src, dst, 5)
+        yield Case("rail_fence_encrypt_file", setup, size, "rails=5")
+
+
+def onetimepad_cases(sizes, cap, workdir):
+    from Algorithms import onetimepad
+    for size in sizes:
+        if size <= cap(1 << 20):
+            def enc(size=size):
+                message, key = digits(size), digits(size)[::-1]
+                return lambda: onetimepad.onetimepad_encrypt(message, key)
+
+            def dec(size=size):
+                key = digits(size)[::-1]
+                cipher = onetimepad.onetimepad_encrypt(digits(size), key)
+                return lambda: onetimepad.onetimepad_decrypt(cipher, key)
+
+            yield Case("onetimepad_encrypt", enc, size)
+            yield Case("onetimepad_decrypt", dec, size)
+
+        def xor(size=size):
+            data, pad = random_bytes(size), random_bytes(size)
+            return lambda: onetimepad.onetimepad_xor(data, pad)
+        yield Case("onetimepad_xor", xor, size)
+
+        def xor_file(size=size):
+            src = _write_file(workdir, f"otp_{size}", size)
+            pad = _write_file(workdir, f"pad_{size}", size)
+            dst = os.path.join(workdir, "otp_out")
+            return lambda: onetimepad.onetimepad_xor_file(src, pad, dst)
+        yield Case("onetimepad_xor_file", xor_file, size)
+
+
+def _rsa_seeds(bits):
+    # Deterministic prime seeds so every run (and the baseline) uses the same key
+    half = bits // 2
+    return (1 << (half - 1)) + 12345, (3 << (half - 2)) + 67891
+
+
+def _rsa_keys(bits):
+    from Algorithms import RSA
+    return RSA.generate_keys(*_rsa_seeds(bits))
+
+
+def rsa_cases(sizes, cap):
+    from Algorithms import RSA
+    key_bits = (512, 1024, 2048)
+    for bits in key_bits:
+        def keys(bits=bits):
+            p, q = _rsa_seeds(bits)
+            return lambda: RSA.generate_keys(p, q)
+        yield Case("generate_keys", keys, 0, f"bits={bits}")
+
+    for bits in (1024, 2048):
+        def random_keys(bits=bits):
+            return lambda: RSA.generate_random_keys(bits, workers=1)
+        yield Case("generate_random_keys", random_keys, 0, f"bits={bits}")
+
+    for bits in key_bits:
+        for size in sizes:
+            if size <= cap(1 << 20):
+                def enc(size=size, bits=bits):
+                    public, _ = _rsa_keys(bits)
+                    text = letters(size)
+                    return lambda: RSA.rsa_encrypt(text, public)
+
+                def dec(size=size, bits=bits):
+                    public, private = _rsa_keys(bits)
+                    cipher = RSA.rsa_encrypt(letters(size), public)
+                    return lambda: RSA.rsa_decrypt(cipher, private)
+
+                yield Case("rsa_encrypt", enc, size, f"bits={bits}")
+                yield Case("rsa_decrypt", dec, size, f"bits={bits}")
+
+            if size <= cap(64 << 10):
+                def enc_bytes(size=size, bits=bits):
+                    public, _ = _rsa_keys(bits)
+                    data = random_bytes(size)
+                    return lambda: RSA.rsa_encrypt_bytes(data, public)
+
+                def dec_bytes(size=size, bits=bits):
+                    public, private = _rsa_keys(bits)
+                    cipher = RSA.rsa_encrypt_bytes(random_bytes(size), public)
+                    return lambda: RSA.rsa_decrypt_bytes(cipher, private)
+
+                yield Case("rsa_encrypt_bytes", enc_bytes, size, f"bits={bits}")
+                yield Case("rsa_decrypt_bytes", dec_bytes, size, f"bits={bits}")
+
+
+def des_cases(sizes, cap):
+    from Algorithms import DES, DES_keygen
+
+    def keygen():
+        return lambda: DES_keygen.des_round_keys(0x133457799BBCDFF1)
+
+    def keygen_gui():
+        # The GUI path: parse, schedule (cache cleared) and format as binary
+        def run():
+            DES_keygen.key_schedule_cache.clear()
+            DES_keygen.des_key_generation("133457799BBCDFF1", as_binary=True)
+        return run
+
+    def keygen_cached():
+        DES_keygen.des_key_generation("133457799BBCDFF1")
+        return lambda: DES_keygen.des_key_generation("133457799BBCDFF1")
+
+    yield Case("des_key_generation", keygen, 0, "uncached")
+    yield Case("des_key_generation", keygen_gui, 0, "gui")
+    yield Case("des_key_generation", keygen_cached, 0, "cached")
+
+    def block_enc():
+        round_keys = DES.des_round_keys(0x133457799BBCDFF1)
+        return lambda: DES.des_crypt_block(0x0123456789ABCDEF, round_keys)
+
+    def triple_block_enc():
+        round_keys = DES.triple_des_round_keys("0123456789ABCDEF23456789ABCDEF01456789ABCDEF0123")
+        return lambda: DES.triple_des_encrypt_block(0x0123456789ABCDEF, round_keys)
+
+    yield Case("des_crypt_block", block_enc, 8)
+    yield Case("triple_des_encrypt_block", triple_block_enc, 8)
+
+    for size in sizes:
+        size8 = size - size % 8
+        if not size8 or size8 > cap(64 << 10):
+            continue
+        for name, fn, key in (
+            ("des_encrypt", DES.des_encrypt, "133457799BBCDFF1"),
+            ("triple_des_encrypt", DES.triple_des_encrypt, "0123456789ABCDEF23456789ABCDEF01"),
+        ):
+            def setup(size8=size8, fn=fn, key=key):
+                data = random_bytes(size8)
+                return lambda: fn(data, key)
+            yield Case(name, setup, size8)
+
+    try:
+        from Algorithms import DES_bitslice
+    except ImportError:  # NumPy is optional
+        return
+    for size in sizes:
+        size8 = size - size % 8
+        if not size8 or size8 > cap(16 << 20):
+            continue
+        for name, fn, key in (
+            ("des_encrypt_bitsliced", DES_bitslice.des_encrypt_bitsliced, "133457799BBCDFF1"),
+            ("triple_des_encrypt_bitsliced", DES_bitslice.triple_des_encrypt_bitsliced,
+             "0123456789ABCDEF23456789ABCDEF01"),
+        ):
+            def setup(size8=size8, fn=fn, key=key):
+                data = random_bytes(size8)
+                return lambda: fn(data, key)
+            yield Case(name, setup, size8)
+
+
+def aes_cases(sizes, cap):
+    from Algorithms import AES_shiftrow as aes
+
+    block_hex = "00112233445566778899aabbccddeeff"
+    block = bytes.fromhex(block_hex)
+
+    def sub_shift():
+        def run():
+            state = aes.block_to_state(block)
+            aes.sub_bytes(state)
+            aes.shift_rows(state)
+        return run
+
+    def sub_shift_hex():
+        return lambda: aes.sub_bytes_shift_rows_hex(block_hex)
+
+    yield Case("aes_sub_bytes_shift_rows", sub_shift, 16)
+    yield Case("aes_sub_bytes_shift_rows_hex", sub_shift_hex, 16)
+
+    for key_bits in (128, 192, 256):
+        key = bytes(range(key_bits // 8))
+
+        def expand(key=key):
+            return lambda: aes.expand_key(key)
+
+        def block_enc(key=key):
+            round_keys = aes.expand_key(key)
+            return lambda: aes.aes_encrypt_block(block, round_keys)
+
+        yield Case("aes_expand_key", expand, 0, f"bits={key_bits}")
+        yield Case("aes_encrypt_block", block_enc, 16, f"bits={key_bits}")
+
+    try:
+        from Algorithms import AES_batch
+    except ImportError:  # NumPy is optional
+        return
+    key = bytes(range(16))
+    for size in sizes:
+        size16 = size - size % 16
+        if not size16 or size16 > cap(16 << 20):
+            continue
+
+        def ecb(size16=size16):
+            data = random_bytes(size16)
+            return lambda: AES_batch.aes_ecb_encrypt(data, key)
+
+        def ctr(size16=size16):
+            data = random_bytes(size16)
+            return lambda: AES_batch.aes_ctr_xor(data, key, 1)
+
+        yield Case("aes_ecb_encrypt", ecb, size16, "bits=128")
+        yield Case("aes_ctr_xor", ctr, size16, "bits=128")
+
+
+def _write_file(workdir, name, size):
+    path = os.path.join(workdir, name)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            for start in range(0, size, 1 << 24):
+                f.write(os.urandom(min(1 << 24, size - start)))
+    return path
+
+
+def all_cases(sizes, no_cap, workdir):
+    def cap(limit):
+        return float("inf") if no_cap else limit
+    yield from rail_fence_cases(sizes, cap)
+    yield from rail_fence_file_cases(sizes, workdir)
+    yield from onetimepad_cases(sizes, cap, workdir)
+    yield from rsa_cases(sizes, cap)
+    yield from des_cases(sizes, cap)
+    yield from aes_cases(sizes, cap)
+
+
+# ---------------------------- RUN / COMPARE ----------------------------
+def run(cases, repeat, min_time, out=sys.stdout):
+    results = {}
+    for case in cases:
+        fn = case.setup()
+        best, median, calls = time_call(fn, repeat, min_time)
+        result = {"best": best, "median": median, "calls": calls, "bytes": case.size}
+        if case.size:
+            result["mb_per_s"] = case.size / best / 1e6
+        results[case.id] = result
+        rate = f"{result['mb_per_s']:10.2f} MB/s" if case.size else " " * 15
+        print(f"{case.id:52s} {best * 1e3:12.4f} ms {rate}  ({calls} calls)", file=out, flush=True)
+    return results
+
+
+def compare(results, baseline, max_slowdown):
+    """
+    Compare best times with the baseline.
+    Returns a list of (case_id, baseline_best, best, ratio) for regressions.
+    """
+    regressions = []
+    for case_id, result in results.items():
+        old = baseline.get(case_id)
+        if old is None:
+            continue
+        ratio = result["best"] / old["best"]
+        if ratio > 1 + max_slowdown:
+            regressions.append((case_id, old["best"], result["best"], ratio))
+    return regressions
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path, results):
+    data = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms in Algorithms/.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"comma-separated input sizes, e.g. 1K,1M,100M (default {DEFAULT_SIZES})")
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="only run cases whose id contains this text (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="minimum calls per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per case")
+    parser.add_argument("--no-cap", action="store_true",
+                        help="run per-character pure-Python paths at every size")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="fail when slower than the baseline")
+    parser.add_argument("--max-slowdown", type=float, default=DEFAULT_MAX_SLOWDOWN,
+                        help="allowed slowdown before failing, as a fraction (default 0.25)")
+    parser.add_argument("--list", action="store_true", help="list case ids and exit")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="crypto-bench-") as workdir:
+        cases = [c for c in all_cases(sizes, args.no_cap, workdir)
+                 if not args.filter or any(f in c.id for f in args.filter)]
+        if args.list:
+            for case in cases:
+                print(case.id)
+            return 0
+        results = run(cases, args.repeat, args.min_time)
+
+    status = 0
+    if args.compare:
+        try:
+            baseline = load_baseline(args.baseline)
+        except FileNotFoundError:
+            print(f"error: no baseline at {args.baseline}; run with --save first", file=sys.stderr)
+            return 2
+        regressions = compare(results, baseline, args.max_slowdown)
+        missing = sorted(set(results) - set(baseline))
+        if missing:
+            print(f"\n{len(missing)} case(s) not in the baseline: {', '.join(missing)}")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.max_slowdown:.0%}:")
+            for case_id, old, new, ratio in regressions:
+                print(f"  {case_id:52s} {old * 1e3:10.4f} ms -> {new * 1e3:10.4f} ms  ({ratio:.2f}x)")
+            status = 1
+        else:
+            print(f"\nNo regressions over {args.max_slowdown:.0%} against {args.baseline}")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Headless command-line front end for the algorithms in Algorithms/.
+
+Reads files (or stdin) in streamed chunks and writes the result to files
+(or stdout), so it runs without a display and can sit in a pipeline:
+
+    python cli.py encrypt -a aes-ctr -k <hex key> --iv <hex counter> big.bin -o big.enc
+    python cli.py decrypt -a des -k 133457799BBCDFF1 *.des --output-dir plain/ --jobs 4
+    cat log.txt | python cli.py encrypt -a rail-fence -k 5 --record-size 4096 > log.rf
+
+All data is treated as bytes. Algorithm modules are imported on first use.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 1 << 20  # multiple of the DES (8) and AES (16) block sizes
+
+
+# ---------------------------- STREAM HELPERS ----------------------------
+def read_exact(src, size):
+    # Pipes may return short reads; block ciphers need whole chunks
+    parts, remaining = [], size
+    while remaining:
+        part = src.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b"".join(parts)
+
+
+def chunks_with_last(src, size):
+    # Yield (chunk, is_last), looking one chunk ahead
+    chunk = read_exact(src, size)
+    while True:
+        following = read_exact(src, size) if len(chunk) == size else b""
+        yield chunk, not following
+        if not following:
+            return
+        chunk = following
+
+
+def pkcs7_pad(data, block):
+    n = block - len(data) % block
+    return data + bytes([n]) * n
+
+
+def pkcs7_unpad(data, block):
+    if not data or len(data) % block or not 1 <= data[-1] <= block or data[-data[-1]:] != bytes([data[-1]]) * data[-1]:
+        raise ValueError("Bad padding: wrong key or corrupted ciphertext")
+    return data[:-data[-1]]
+
+
+def block_stream(src, dst, transform, block, encrypt):
+    # ECB-style stream with PKCS#7 padding on the final chunk
+    for chunk, last in chunks_with_last(src, CHUNK_SIZE):
+        if encrypt:
+            dst.write(transform(pkcs7_pad(chunk, block) if last else chunk))
+        else:
+            if len(chunk) % block:
+                raise ValueError(f"Ciphertext length must be a multiple of {block} bytes")
+            out = transform(chunk)
+            dst.write(pkcs7_unpad(out, block) if last else out)
+
+
+# ---------------------------- ALGORITHMS ----------------------------
+# Each streamer is stream(encrypt, key, options, src, dst, src_path, dst_path)
+# where src/dst are binary file objects and the paths are None for stdin/stdout.
+def stream_multiplicative(encrypt, key, options, src, dst, src_path, dst_path):
+    from Algorithms.multiplicative import affine_encrypt, affine_decrypt
+    a, _, b = key.partition(",")
+    a, b = int(a), int(b or 0)
+    fn = affine_encrypt if encrypt else affine_decrypt
+    for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+        dst.write(fn(chunk, a, b))
+
+
+def stream_otp(encrypt, key, options, src, dst, src_path, dst_path):
+    from Algorithms.onetimepad import onetimepad_xor, onetimepad_xor_file
+    if src_path and dst_path:
+        onetimepad_xor_file(src_path, key, dst_path)
+        return
+    with open(key, "rb") as pad:
+        for chunk in iter(lambda: read_exact(src, CHUNK_SIZE), b""):
+            dst.write(onetimepad_xor(chunk, read_exact(pad, len(chunk))))
+
+
+def stream_rail_fence(encrypt, key, options, src, dst, src_path, dst_path):
+    from Algorithms import rail_fence
+    rails = int(key)
+    if options.record_size:
+        records = rail_fence.rail_fence_encrypt_records if encrypt else rail_fence.rail_fence_decrypt_records
+        for record in records(iter(lambda: src.read(CHUNK_SIZE), b""), rails, options.record_size):
+            dst.write(record)
+    elif src_path and dst_path:
+        fn = rail_fence.rail_fence_encrypt_file if encrypt else rail_fence.rail_fence_decrypt_file
+        fn(src_path, dst_path, rails)
+    else:
+        # Whole-message mode on a pipe has to see the whole input
+        data = src.read()
+        records = rail_fence.rail_fence_encrypt_records if encrypt else rail_fence.rail_fence_decrypt_records
+        dst.write(b"".join(records([data], rails, max(len(data), 1))))
+
+
+def des_functions(triple):
+    # Bitsliced NumPy engine when available, per-block DES otherwise (same output)
+    try:
+        from Algorithms import DES_bitslice as engine
+        suffix = "_bitsliced"
+    except ImportError:
+        from Algorithms import DES as engine
+        suffix = ""
+    prefix = "triple_des" if triple else "des"
+    return getattr(engine, f"{prefix}_encrypt{suffix}"), getattr(engine, f"{prefix}_decrypt{suffix}")
+
+
+def stream_des(encrypt, key, options, src, dst, src_path, dst_path):
+    fn = des_functions(False)[0 if encrypt else 1]
+    block_stream(src, dst, lambda data: fn(data, key), 8, encrypt)
+
+
+def stream_3des(encrypt, key, options, src, dst, src_path, dst_path):
+    fn = des_functions(True)[0 if encrypt else 1]
+    block_stream(src, dst, lambda data: fn(data, key), 8, encrypt)
+
+
+def stream_aes_ctr(encrypt, key, options, src, dst, src_path, dst_path):
+    from Algorithms.AES_ctr import aes_ctr_stream
+    if not options.iv:
+        raise ValueError("aes-ctr needs --iv (32 hex digits)")
+    aes_ctr_stream(src, dst, bytes.fromhex(key), bytes.fromhex(options.iv), workers=options.workers)
+
+
+def stream_rsa(encrypt, key, options, src, dst, src_path, dst_path):
+    from Algorithms.RSA import LENGTH_HEADER_SIZE, block_sizes, rsa_encrypt_bytes, rsa_decrypt_bytes
+    exponent, n = (int(part) for part in key.split(","))
+    plain_size, cipher_size = block_sizes(n)
+    # Each record is an independent byte-mode ciphertext of up to 256 blocks
+    record = plain_size * 256
+    if encrypt:
+        for chunk in iter(lambda: read_exact(src, record), b""):
+            dst.write(rsa_encrypt_bytes(chunk, (exponent, n)))
+        return
+    while True:
+        header = read_exact(src, LENGTH_HEADER_SIZE)
+        if not header:
+            return
+        length = int.from_bytes(header, "big")
+        blocks = -(-length // plain_size)
+        dst.write(rsa_decrypt_bytes(header + read_exact(src, blocks * cipher_size), (exponent, n)))
+
+
+STREAMERS = {
+    "multiplicative": (stream_multiplicative, "a or a,b (affine)"),
+    "otp": (stream_otp, "path to the pad file"),
+    "rail-fence": (stream_rail_fence, "number of rails"),
+    "des": (stream_des, "16 hex digits or 64 bits"),
+    "3des": (stream_3des, "32 or 48 hex digits"),
+    "aes-ctr": (stream_aes_ctr, "32/48/64 hex digits"),
+    "rsa": (stream_rsa, "e,n to encrypt or d,n to decrypt"),
+}
+
+# Stream ciphers whose keystream depends only on the key (and --iv): every
+# input would be XORed with the same bytes, so they take one input per run
+KEYSTREAM_ALGORITHMS = frozenset({"aes-ctr", "otp"})
+
+
+# ---------------------------- DRIVER ----------------------------
+def check_output_path(algorithm, key, src_path, dst_path):
+    # dst is opened with "wb" before anything is read, which would empty the
+    # input (or the OTP pad) if it were the same file
+    if not dst_path or not os.path.exists(dst_path):
+        return
+    protected = [path for path in (src_path, key if algorithm == "otp" else None) if path and os.path.exists(path)]
+    if any(os.path.samefile(dst_path, path) for path in protected):
+        raise ValueError(f"output {dst_path} is the same file as an input")
+
+
+def process(algorithm, encrypt, key, options, src_path, dst_path):
+    # Runs in a worker process for multi-file jobs; returns an error string or None
+    stream = STREAMERS[algorithm][0]
+    try:
+        check_output_path(algorithm, key, src_path, dst_path)
+        src = open(src_path, "rb") if src_path else sys.stdin.buffer
+        try:
+            dst = open(dst_path, "wb") if dst_path else sys.stdout.buffer
+            try:
+                stream(encrypt, key, options, src, dst, src_path, dst_path)
+            finally:
+                if dst_path:
+                    dst.close()
+                else:
+                    dst.flush()
+        finally:
+            if src_path:
+                src.close()
+    except Exception as e:
+        return f"{src_path or '<stdin>'}: {e}"
+    return None
+
+
+def output_path(src_path, args):
+    suffix = "." + (args.suffix or ("enc" if args.action == "encrypt" else "dec"))
+    if args.output_dir:
+        return os.path.join(args.output_dir, os.path.basename(src_path) + suffix)
+    return src_path + suffix
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt files and streams without the GUI.")
+    parser.add_argument("action", choices=("encrypt", "decrypt"))
+    parser.add_argument("inputs", nargs="*", help="input files (default: stdin; '-' also means stdin)")
+    parser.add_argument("-a", "--algorithm", required=True, choices=sorted(STREAMERS))
+    parser.add_argument("-k", "--key", required=True,
+                        help="; ".join(f"{name}: {hint}" for name, (_, hint) in sorted(STREAMERS.items())))
+    parser.add_argument("-o", "--output", help="output file for a single input (default: stdout)")
+    parser.add_argument("--output-dir", help="directory for outputs when there are several inputs")
+    parser.add_argument("--suffix", help="suffix for multi-file outputs (default: enc/dec)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="files processed in parallel")
+    parser.add_argument("--iv", help="aes-ctr initial counter block, 32 hex digits")
+    parser.add_argument("--record-size", type=int, default=0,
+                        help="rail-fence: transpose fixed-size records instead of the whole input")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_intermixed_args(argv)
+    encrypt = args.action == "encrypt"
+    inputs = [None if path == "-" else path for path in args.inputs] or [None]
+    if args.jobs < 1:
+        print("error: --jobs must be at least 1", file=sys.stderr)
+        return 2
+    if len(inputs) > 1 and None in inputs:
+        print("error: stdin cannot be mixed with other inputs", file=sys.stderr)
+        return 2
+    if len(inputs) > 1 and args.algorithm in KEYSTREAM_ALGORITHMS:
+        print(f"error: {args.algorithm} takes one input per run; reusing its keystream "
+              "across files would leak their XOR", file=sys.stderr)
+        return 2
+
+    if len(inputs) == 1:
+        jobs = [(inputs[0], args.output)]
+        # a single aes-ctr input spreads its chunks over the --jobs workers instead
+        args.workers = args.jobs
+    else:
+        if args.output:
+            print("error: use --output-dir (or the default suffix) with several inputs", file=sys.stderr)
+            return 2
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        jobs = [(path, output_path(path, args) if path else None) for path in inputs]
+        args.workers = 1
+
+    calls = [(args.algorithm, encrypt, args.key, args, src, dst) for src, dst in jobs]
+    if args.jobs > 1 and len(calls) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            errors = list(pool.map(process, *zip(*calls)))
+    else:
+        errors = [process(*call) for call in calls]
+
+    failed = [e for e in errors if e]
+    for message in failed:
+        print(f"error: {message}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,392 @@
+"""
+Local encryption service: the algorithms in Algorithms/ behind an asyncio
+server on a Unix socket or a localhost TCP port, shared by many clients.
+
+    python service.py --unix /tmp/crypto.sock --workers 4
+    python service.py --port 8765
+
+Protocol: one JSON object per line in each direction. Requests may be
+pipelined; responses carry the request's "id" and can arrive out of order.
+
+    {"id": 1, "algorithm": "Rail Fence", "action": "encrypt", "message": "HELLO", "key": "3"}
+    {"id": 2, "algorithm": "RSA", "action": "keygen", "key": [61, 53]}
+    {"id": 3, "algorithm": "DES-ECB", "action": "encrypt", "message": "<base64>",
+     "key": "133457799BBCDFF1", "encoding": "base64"}
+    {"id": 4, "action": "stats"}
+
+    -> {"id": 1, "result": "HOLEL"}   or   {"id": 1, "error": "..."}
+
+Algorithms are the GUI registry names plus the byte ciphers in EXTRA_ALGORITHMS.
+With "encoding": "base64", the message is decoded to bytes and a bytes result
+is encoded back. RSA keys are [e, n] / [d, n] lists; keygen returns the private
+key as [d, n, p, q], which decrypts through the faster CRT path.
+
+Requests for the same (algorithm, action, key) that arrive within --batch-window
+milliseconds are coalesced into one micro-batch. Each batch runs as a single job
+on a process pool, so RSA and DES never block the event loop and each batch
+pays one IPC round trip and one key-schedule lookup. The workers are
+long-lived, so their key-schedule and translation-table caches stay warm.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import stat
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from Algorithms.registry import ALGORITHMS, Algorithm, InputError, get_algorithm
+
+DEFAULT_BATCH_WINDOW = 0.002  # seconds to wait for more requests with the same key
+DEFAULT_MAX_BATCH = 256
+MAX_LINE = 64 << 20  # largest request line accepted, in bytes
+
+# Byte-oriented ciphers not shown in the GUI (base64 messages)
+EXTRA_ALGORITHMS = {
+    algorithm.name: algorithm for algorithm in (
+        Algorithm("DES-ECB", "Algorithms.DES", encrypt="des_encrypt", decrypt="des_decrypt"),
+        Algorithm("3DES-ECB", "Algorithms.DES", encrypt="triple_des_encrypt", decrypt="triple_des_decrypt"),
+    )
+}
+
+
+def lookup(name):
+    if name in EXTRA_ALGORITHMS:
+        return EXTRA_ALGORITHMS[name]
+    return get_algorithm(name)
+
+
+# ---------------------------- WORKER SIDE ----------------------------
+# Runs in the pool processes. Only names, keys and messages cross the process
+# boundary; the algorithm modules are imported once per worker.
+def _warm_up(names):
+    for name in names:
+        try:
+            lookup(name).load()
+        except Exception:
+            pass
+
+
+def _normalize_key(algorithm, key):
+    # JSON has no tuples: RSA keys arrive as [e, n] lists, and a private key
+    # from keygen as [d, n, p, q], which is rebuilt for the CRT decrypt path
+    if isinstance(key, list):
+        if algorithm.name == "RSA" and len(key) == 4:
+            return algorithm.function("RSAPrivateKey")(*(int(x) for x in key))
+        return tuple(key)
+    return key
+
+
+def _keygen(algorithm, key):
+    if algorithm.name == "DES":
+        return algorithm.function("des_key_generation")(key)
+    if algorithm.name == "RSA":
+        p, q = (int(x) for x in key)
+        public, private = algorithm.function("generate_keys")(p, q)
+        return {"public": list(public), "private": [private.d, private.n, private.p, private.q]}
+    raise InputError(f"{algorithm.name} has no key generation")
+
+
+def run_batch(name, action, key, messages, encoding):
+    """
+    Apply one action with one key to every message.
+    Returns [(ok, result_or_error), ...] in order. A bad message fails only
+    its own entry.
+    """
+    algorithm = lookup(name)
+    try:
+        key = _normalize_key(algorithm, key)
+    except Exception as e:
+        return [(False, f"Invalid key: {e}")] * len(messages)
+    results = []
+    for message in messages:
+        try:
+            if action == "keygen":
+                result = _keygen(algorithm, key)
+            else:
+                if encoding == "base64":
+                    message = base64.b64decode(message)
+                result = getattr(algorithm, action)(message, key)
+                if isinstance(result, (bytes, bytearray)):
+                    result = base64.b64encode(result).decode("ascii")
+            results.append((True, result))
+        except InputError as e:
+            results.append((False, str(e)))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+# ---------------------------- MICRO-BATCHING ----------------------------
+class _Batch:
+    __slots__ = ("name", "action", "key", "encoding", "messages", "futures", "timer")
+
+    def __init__(self, name, action, key, encoding):
+        self.name = name
+        self.action = action
+        self.key = key
+        self.encoding = encoding
+        self.messages = []
+        self.futures = []
+        self.timer = None
+
+
+class MicroBatcher:
+    """
+    Coalesces submits with the same (algorithm, action, key, encoding).
+    A batch is flushed after `window` seconds or when it reaches `max_batch`.
+    """
+
+    def __init__(self, pool, window=DEFAULT_BATCH_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+        self.pool = pool
+        self.window = window
+        self.max_batch = max_batch
+        self._open = {}
+        self.requests = 0
+        self.batches = 0
+
+    async def submit(self, name, action, key, message, encoding=None):
+        loop = asyncio.get_running_loop()
+        batch_id = (name, action, json.dumps(key, sort_keys=True), encoding)
+        batch = self._open.get(batch_id)
+        if batch is None:
+            batch = self._open[batch_id] = _Batch(name, action, key, encoding)
+            batch.timer = loop.call_later(self.window, self._flush, batch_id)
+        future = loop.create_future()
+        batch.messages.append(message)
+        batch.futures.append(future)
+        self.requests += 1
+        if len(batch.messages) >= self.max_batch:
+            batch.timer.cancel()
+            self._flush(batch_id)
+        return await future
+
+    def _flush(self, batch_id):
+        batch = self._open.pop(batch_id, None)
+        if batch is None:
+            return
+        self.batches += 1
+        job = asyncio.get_running_loop().run_in_executor(
+            self.pool, run_batch, batch.name, batch.action, batch.key, batch.messages, batch.encoding)
+        job.add_done_callback(lambda job, futures=batch.futures: self._deliver(job, futures))
+
+    @staticmethod
+    def _deliver(job, futures):
+        error = job.exception()
+        results = job.result() if error is None else None
+        for i, future in enumerate(futures):
+            if future.done():  # client went away
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else None,
+            "open_batches": len(self._open),
+        }
+
+
+# ---------------------------- SERVER ----------------------------
+class EncryptionService:
+    def __init__(self, workers=None, window=DEFAULT_BATCH_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+        self.workers = workers or os.cpu_count() or 1
+        names = list(ALGORITHMS) + list(EXTRA_ALGORITHMS)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up, initargs=(names,))
+        self.batcher = MicroBatcher(self.pool, window, max_batch)
+        self.connections = 0
+
+    async def handle_request(self, request):
+        action = request.get("action")
+        if action == "stats":
+            return {**self.batcher.stats(), "workers": self.workers, "connections": self.connections}
+        if action not in ("encrypt", "decrypt", "keygen"):
+            raise InputError(f"Unknown action: {action!r}")
+        name = request.get("algorithm")
+        try:
+            lookup(name)
+        except KeyError as e:
+            raise InputError(e.args[0]) from None
+        ok, result = await self.batcher.submit(
+            name, action, request.get("key"), request.get("message", ""), request.get("encoding"))
+        if not ok:
+            raise InputError(result)
+        return result
+
+    async def _respond(self, request, writer, lock):
+        response = {"id": request.get("id")}
+        try:
+            response["result"] = await self.handle_request(request)
+        except InputError as e:
+            response["error"] = str(e)
+        except Exception as e:
+            response["error"] = f"{type(e).__name__}: {e}"
+        async with lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        self.connections += 1
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b'{"id": null, "error": "Request line too long"}\n')
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    async with lock:
+                        writer.write(json.dumps({"id": None, "error": f"Bad request: {e}"}).encode() + b"\n")
+                    continue
+                task = asyncio.create_task(self._respond(request, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, unix_path=None, host="127.0.0.1", port=0):
+        if unix_path:
+            remove_stale_socket(unix_path)
+            return await asyncio.start_unix_server(self.handle_connection, unix_path, limit=MAX_LINE)
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def remove_stale_socket(path):
+    # Only a socket left behind by an earlier server may be replaced; any
+    # other file at the path is refused rather than deleted
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+
+# ---------------------------- CLIENT ----------------------------
+class ServiceClient:
+    """
+    Minimal asyncio client; request() may be called concurrently.
+
+        client = await ServiceClient.connect(unix_path="/tmp/crypto.sock")
+        cipher = await client.request("Rail Fence", "encrypt", "HELLO", "3")
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._next_id = 0
+        self._waiting = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, unix_path=None, host="127.0.0.1", port=None):
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _receive(self):
+        try:
+            while line := await self.reader.readline():
+                response = json.loads(line)
+                future = self._waiting.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Service connection closed"))
+
+    async def call(self, **request):
+        """Send a raw request dict; returns the response dict"""
+        self._next_id += 1
+        request["id"] = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[self._next_id] = future
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        return await future
+
+    async def request(self, algorithm, action, message="", key=None, encoding=None):
+        """Returns the result, or raises InputError with the service's message"""
+        response = await self.call(algorithm=algorithm, action=action, message=message, key=key, encoding=encoding)
+        if "error" in response:
+            raise InputError(response["error"])
+        return response["result"]
+
+    async def close(self):
+        self.writer.close()
+        self._receiver.cancel()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+# ---------------------------- MAIN ----------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serve the encryption algorithms to local clients.")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--unix", help="Unix socket path")
+    where.add_argument("--port", type=int, default=8765, help="localhost TCP port (default 8765)")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP bind address (default 127.0.0.1)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: cores)")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW * 1e3,
+                        help="milliseconds to collect a micro-batch (default 2)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="requests per micro-batch")
+    return parser
+
+
+async def serve(args):
+    service = EncryptionService(args.workers, args.batch_window / 1e3, args.max_batch)
+    server = await service.start(args.unix, args.host, args.port)
+    where = args.unix or ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving on {where} with {service.workers} workers", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+        if args.unix:
+            remove_stale_socket(args.unix)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    except FileExistsError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())